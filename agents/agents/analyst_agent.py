@@ -6,11 +6,15 @@ incidents to determine the root cause. The agent is implemented as a runnable
 chain that takes an incident as input and returns a root cause analysis.
 """
 
-import json
-
-from prompts.analyst_prompt import ANALYST_HUMAN_PROMPT, ANALYST_SYSTEM_PROMPT
+from config import config
+from prompts.analyst_prompt import (
+    ANALYST_BATCH_HUMAN_PROMPT,
+    ANALYST_HUMAN_PROMPT,
+    ANALYST_SYSTEM_PROMPT,
+)
+from prompts.kubectl_cookbook import select_cookbook
 from utils import BaseAgent
-from utils.parsers import analysis_parser
+from utils.parsers import AnalysisBatch, AnalysisResult, analysis_parser
 
 
 class AnalystAgent(BaseAgent):
@@ -19,13 +23,53 @@ class AnalystAgent(BaseAgent):
             llm=llm,
             tools=tools,
             system_prompt=ANALYST_SYSTEM_PROMPT,
+            human_prompt=ANALYST_HUMAN_PROMPT,
+            response_format=AnalysisResult,
             agent_name="analyst_agent",
             parser=analysis_parser,
             debug=debug,
         )
+        # Same analyst, answering for several incidents in one run
+        self._packed = BaseAgent(
+            llm=llm,
+            tools=tools,
+            system_prompt=ANALYST_SYSTEM_PROMPT,
+            human_prompt=ANALYST_BATCH_HUMAN_PROMPT,
+            response_format=AnalysisBatch,
+            agent_name="analyst_batch_agent",
+            debug=debug,
+        )
 
     def run(self, alert_data: dict) -> dict:
-        human_prompt = ANALYST_HUMAN_PROMPT.format(
-            alert_data=json.dumps(alert_data, indent=2, ensure_ascii=False)
+        return super().run(self._format_prompt(alert_data))
+
+    async def arun(self, alert_data: dict) -> dict:
+        return await super().arun(self._format_prompt(alert_data))
+
+    async def abatch(self, alerts: list) -> list:
+        """Analyze alerts, packing up to ANALYSIS_PACK_SIZE into one prompt"""
+        payloads = [self._dumps_alert(alert) for alert in alerts]
+        return await self._abatch_packed(
+            self._packed,
+            [
+                self._format_prompt(alert, payload)
+                for alert, payload in zip(alerts, payloads)
+            ],
+            payloads,
+            lambda pack: self._format_pack(pack, alerts, payloads),
+            config.ANALYSIS_PACK_SIZE,
+            config.ANALYSIS_PACK_MAX_CHARS,
+            "analyses",
+        )
+
+    def _format_prompt(self, alert_data: dict, payload: str = None) -> str:
+        return self._render(
+            alert_data=payload or self._dumps_alert(alert_data),
+            cookbook=select_cookbook((alert_data,)),
+        )
+
+    def _format_pack(self, pack: list, alerts: list, payloads: list) -> str:
+        return self._packed._render(
+            alerts="\n\n".join(f"INCIDENT [{i}]:\n{payloads[i]}" for i in pack),
+            cookbook=select_cookbook(alerts[i] for i in pack),
         )
-        return super().run(human_prompt)
@@ -7,13 +7,15 @@ an incident and an approved plan as input, executes the steps, and returns
 the execution results and a summary.
 """
 
-import json
-import uuid
-
 from prompts.executor_prompt import EXECUTOR_HUMAN_PROMPT, EXECUTOR_SYSTEM_PROMPT
 from utils import BaseAgent
+from utils.ids import new_uuid
+from utils.json_utils import dumps_shared
 from utils.parsers import execution_parser
 
+# Fields of the tab-separated line the executor reports for each step
+STEP_FIELDS = ("step", "action", "command", "status", "duration_ms", "error")
+
 
 class ExecutorAgent(BaseAgent):
     def __init__(self, llm, tools: list, debug: bool = False):
@@ -21,19 +23,97 @@ class ExecutorAgent(BaseAgent):
             llm=llm,
             tools=tools,
             system_prompt=EXECUTOR_SYSTEM_PROMPT,
+            human_prompt=EXECUTOR_HUMAN_PROMPT,
             agent_name="executor_agent",
             parser=execution_parser,
             debug=debug,
         )
 
-    def run(self, approved_plan: dict, alert_data: dict, analysis_result: dict) -> dict:
-        human_prompt = EXECUTOR_HUMAN_PROMPT.format(
-            approved_plan=json.dumps(approved_plan, indent=2, ensure_ascii=False),
-            alert_data=json.dumps(alert_data, indent=2, ensure_ascii=False),
-            analysis_result=json.dumps(analysis_result, indent=2, ensure_ascii=False),
+    def run(
+        self,
+        approved_plan: dict,
+        alert_data: dict,
+        analysis_result: dict,
+        authorized_by: str = None,
+    ) -> dict:
+        human_prompt = self._format_prompt(
+            approved_plan, alert_data, analysis_result, authorized_by
+        )
+        return self._finalize(super().run(human_prompt))
+
+    async def arun(
+        self,
+        approved_plan: dict,
+        alert_data: dict,
+        analysis_result: dict,
+        authorized_by: str = None,
+    ) -> dict:
+        human_prompt = self._format_prompt(
+            approved_plan, alert_data, analysis_result, authorized_by
+        )
+        return self._finalize(await super().arun(human_prompt))
+
+    async def astream(
+        self,
+        approved_plan: dict,
+        alert_data: dict,
+        analysis_result: dict,
+        authorized_by: str = None,
+    ):
+        """Stream the execution report as it is written; the last item is final"""
+        human_prompt = self._format_prompt(
+            approved_plan, alert_data, analysis_result, authorized_by
+        )
+        previous = None
+        async for result in super().astream(human_prompt):
+            if previous is not None:
+                yield previous
+            previous = result
+        yield self._finalize(previous)
+
+    def _format_prompt(
+        self,
+        approved_plan: dict,
+        alert_data: dict,
+        analysis_result: dict,
+        authorized_by: str = None,
+    ) -> str:
+        return self._render(
+            **self._build_inputs(
+                approved_plan, alert_data, analysis_result, authorized_by
+            )
         )
-        result = super().run(human_prompt)
-        # Ensure execution_id exists
-        if isinstance(result, dict) and not result.get("execution_id"):
-            result["execution_id"] = str(uuid.uuid4())
+
+    @staticmethod
+    def _build_inputs(
+        approved_plan: dict,
+        alert_data: dict,
+        analysis_result: dict,
+        authorized_by: str = None,
+    ) -> dict:
+        """Build every EXECUTOR_HUMAN_PROMPT field in a single pass"""
+        return {
+            "remediation_plan": dumps_shared(approved_plan),
+            "plan_id": approved_plan.get("plan_id", "N/A"),
+            "authorized_by": authorized_by or "Unknown",
+            "execution_window": "Immediate",
+            "risk_level": approved_plan.get("risk_level", "unknown"),
+            "alert_data": BaseAgent._dumps_alert(alert_data),
+            "analysis_result": dumps_shared(analysis_result),
+        }
+
+    @staticmethod
+    def _finalize(result):
+        """Add an execution id and expand step lines into step records"""
+        if isinstance(result, dict):
+            if not result.get("execution_id"):
+                result["execution_id"] = new_uuid()
+            steps = result.get("executed_steps")
+            if isinstance(steps, list):
+                result["executed_steps"] = [
+                    dict(zip(STEP_FIELDS, step.split("\t", len(STEP_FIELDS) - 1)))
+                    if isinstance(step, str)
+                    else step
+                    for step in steps
+                ]
         return result
@@ -7,11 +7,15 @@ as a runnable chain that takes an incident and root cause analysis as input
 and returns a list of proposed remediation plans.
 """
 
-import json
-
-from prompts.planner_prompt import PLANNER_HUMAN_PROMPT, PLANNER_SYSTEM_PROMPT
+from config import config
+from prompts.planner_prompt import (
+    PLANNER_BATCH_HUMAN_PROMPT,
+    PLANNER_HUMAN_PROMPT,
+    PLANNER_SYSTEM_PROMPT,
+)
 from utils import BaseAgent
-from utils.parsers import plan_parser
+from utils.json_utils import dumps_shared
+from utils.parsers import RemediationPlan, plan_parser
 
 
 class PlannerAgent(BaseAgent):
@@ -20,14 +24,65 @@ class PlannerAgent(BaseAgent):
             llm=llm,
             tools=tools,
             system_prompt=PLANNER_SYSTEM_PROMPT,
+            human_prompt=PLANNER_HUMAN_PROMPT,
+            response_format=RemediationPlan,
             agent_name="planner_agent",
             parser=plan_parser,
             debug=debug,
         )
+        # Plans several incidents at once for batches of planning requests
+        self._packed = BaseAgent(
+            llm=llm,
+            tools=tools,
+            system_prompt=PLANNER_SYSTEM_PROMPT,
+            human_prompt=PLANNER_BATCH_HUMAN_PROMPT,
+            agent_name="planner_batch_agent",
+            debug=debug,
+        )
 
     def run(self, analysis_result: dict, alert_data: dict) -> dict:
-        human_prompt = PLANNER_HUMAN_PROMPT.format(
-            analysis_result=json.dumps(analysis_result, indent=2, ensure_ascii=False),
-            alert_data=json.dumps(alert_data, indent=2, ensure_ascii=False),
+        return super().run(self._format_prompt(analysis_result, alert_data))
+
+    async def arun(self, analysis_result: dict, alert_data: dict) -> dict:
+        return await super().arun(self._format_prompt(analysis_result, alert_data))
+
+    def astream_batch(self, requests: list):
+        """Plan (analysis_result, alert_data) pairs, packing up to PLAN_PACK_SIZE.
+
+        Yields (index, plan) as soon as each plan is complete.
+        """
+        return self._astream_packed(*self._pack_args(requests))
+
+    def _pack_args(self, requests: list) -> tuple:
+        payloads = [
+            (dumps_shared(analysis_result), self._dumps_alert(alert_data))
+            for analysis_result, alert_data in requests
+        ]
+        return (
+            self._packed,
+            [
+                self._render(analysis_result=analysis, alert_data=alert)
+                for analysis, alert in payloads
+            ],
+            [analysis + alert for analysis, alert in payloads],
+            lambda pack: self._format_pack(pack, payloads),
+            config.PLAN_PACK_SIZE,
+            config.PLAN_PACK_MAX_CHARS,
+            "plans",
+        )
+
+    def _format_prompt(self, analysis_result: dict, alert_data: dict) -> str:
+        return self._render(
+            analysis_result=dumps_shared(analysis_result),
+            alert_data=self._dumps_alert(alert_data),
+        )
+
+    def _format_pack(self, pack: list, payloads: list) -> str:
+        return self._packed._render(
+            incidents="\n\n".join(
+                f"INCIDENT [{i}]:\n"
+                f"DIAGNOSTIC ANALYSIS RESULTS:\n{payloads[i][0]}\n"
+                f"ORIGINAL INCIDENT ALERT:\n{payloads[i][1]}"
+                for i in pack
+            )
         )
-        return super().run(human_prompt)
@@ -5,8 +5,18 @@ from agents.analyst_agent import AnalystAgent
 from agents.executor_agent import ExecutorAgent
 from agents.planner_agent import PlannerAgent
 
+# Compiled supervisor graphs by the identity of the LLM and tools they wrap.
+# Entries hold the llm and tools so their ids stay valid while cached.
+_supervisors = {}
+
 
 def supervisor_agent(llm, tools):
+    """Return the compiled supervisor for llm and tools, compiling it once"""
+    key = (id(llm), tuple(id(tool) for tool in tools))
+    cached = _supervisors.get(key)
+    if cached is not None:
+        return cached[-1]
+
     # analyst_tools = get_analysis_tools()
     # planner_tools = get_planner_tools()
     # executor_tools = get_executor_tools()
@@ -20,4 +30,5 @@ def supervisor_agent(llm, tools):
         add_handoff_back_messages=True,
         output_mode="full_history",
     ).compile()
+    _supervisors[key] = (llm, list(tools), supervisor)
     return supervisor
@@ -6,13 +6,16 @@ environment variables using pydantic-settings for robust and type-safe
 configuration management.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from dotenv import load_dotenv
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
-
-load_dotenv()
+from pydantic import Field, PrivateAttr
+from pydantic_settings import (
+    BaseSettings,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
 
 
 class Config(BaseSettings):
@@ -59,28 +62,134 @@ class Config(BaseSettings):
     # LLM Configuration
     GOOGLE_API_KEY: Optional[str] = Field(default=None, alias="GOOGLE_API_KEY")
     TAVILY_API_KEY: Optional[str] = Field(default=None, alias="TAVILY_API_KEY")
+    LLM_CACHE_ENABLED: bool = Field(default=True, alias="LLM_CACHE_ENABLED")
+    # SQLite file for the LLM response cache; in-memory when unset.
+    LLM_CACHE_PATH: Optional[str] = Field(default=None, alias="LLM_CACHE_PATH")
+    # Entries kept by the in-memory LLM cache before the oldest are evicted.
+    LLM_CACHE_MAXSIZE: int = Field(default=1024, alias="LLM_CACHE_MAXSIZE")
+    LLM_MAX_CONCURRENCY: int = Field(default=8, alias="LLM_MAX_CONCURRENCY")
+    # Smaller model tried first for info alerts; unset sends everything to the
+    # default model.
+    LIGHT_LLM_MODEL: Optional[str] = Field(default=None, alias="LIGHT_LLM_MODEL")
+    # Send a one-word prompt at startup so the first alert reuses a warm connection.
+    STARTUP_WARMUP: bool = Field(default=True, alias="STARTUP_WARMUP")
+    # Tool results longer than this are cut to their tail for the LLM; 0 keeps all.
+    TOOL_OUTPUT_MAX_LINES: int = Field(default=200, alias="TOOL_OUTPUT_MAX_LINES")
+    # Only the most recent tool results keep that many lines; older ones are cut
+    # to a short tail. 0 treats every result as recent.
+    TOOL_OUTPUT_RECENT: int = Field(default=6, alias="TOOL_OUTPUT_RECENT")
+
+    # Batching Configuration
+    BATCH_MAX_SIZE: int = Field(default=16, alias="BATCH_MAX_SIZE")
+    BATCH_WINDOW_MS: int = Field(default=50, alias="BATCH_WINDOW_MS")
+    # Alerts analyzed together in a single packed prompt; 1 disables packing.
+    ANALYSIS_PACK_SIZE: int = Field(default=4, alias="ANALYSIS_PACK_SIZE")
+    # Packs whose serialized alerts exceed this are analyzed one by one.
+    ANALYSIS_PACK_MAX_CHARS: int = Field(default=20000, alias="ANALYSIS_PACK_MAX_CHARS")
+    # Serialized alerts longer than this are cut from the middle in prompts; 0 keeps all.
+    ALERT_PROMPT_MAX_CHARS: int = Field(default=20000, alias="ALERT_PROMPT_MAX_CHARS")
+    # Output tokens allowed per analysis, thinking included; analyst model turns
+    # are capped at this times ANALYSIS_PACK_SIZE. 0 keeps the model's default.
+    ANALYSIS_MAX_OUTPUT_TOKENS: int = Field(
+        default=2048, alias="ANALYSIS_MAX_OUTPUT_TOKENS"
+    )
+    # Planning requests wait this long for others to plan in the same call.
+    PLAN_BATCH_WINDOW_MS: int = Field(default=250, alias="PLAN_BATCH_WINDOW_MS")
+    # Incidents planned together in a single packed prompt; 1 disables packing.
+    PLAN_PACK_SIZE: int = Field(default=8, alias="PLAN_PACK_SIZE")
+    # Packs whose serialized analyses and alerts exceed this are planned one by one.
+    PLAN_PACK_MAX_CHARS: int = Field(default=40000, alias="PLAN_PACK_MAX_CHARS")
+
+    # Analysis Cache Configuration
+    # Seconds an analysis is reused for repeats of the same alert; 0 disables.
+    ANALYSIS_CACHE_TTL: int = Field(default=60, alias="ANALYSIS_CACHE_TTL")
+    ANALYSIS_CACHE_SIZE: int = Field(default=4096, alias="ANALYSIS_CACHE_SIZE")
+    # Seconds a plan is reused for the same alert and root cause; 0 disables.
+    PLAN_CACHE_TTL: int = Field(default=300, alias="PLAN_CACHE_TTL")
+    PLAN_CACHE_SIZE: int = Field(default=1024, alias="PLAN_CACHE_SIZE")
+    # Seconds an incident's status and result stay available for polling.
+    INCIDENT_RETENTION_SECONDS: int = Field(
+        default=3600, alias="INCIDENT_RETENTION_SECONDS"
+    )
+    INCIDENT_RETENTION_SIZE: int = Field(default=1024, alias="INCIDENT_RETENTION_SIZE")
 
     # Server Configuration
     HOST: str = Field(default="0.0.0.0", alias="HOST")
     PORT: int = Field(default=3000, alias="PORT")
-
-    def get_llm_settings(self) -> Dict[str, Any]:
+    # Pending Slack approvals live in process memory, so only raise this when
+    # button clicks are guaranteed to reach the worker that sent the plan.
+    WORKERS: int = Field(default=1, alias="WORKERS")
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Read only init arguments and the environment.
+
+        .env is loaded into the environment by load_dotenv() and no secrets
+        directory is configured, so the dotenv and file-secret sources would
+        only repeat the lookups for every field.
+        """
+        return init_settings, env_settings
+
+    # Read-only snapshot of the LLM settings, rebuilt after update()
+    _llm_settings: Optional[Mapping[str, Any]] = PrivateAttr(default=None)
+
+    def get_llm_settings(self) -> Mapping[str, Any]:
         """Get the settings for LLM initialization."""
-        return {
-            "api_key": self.llm_api_key,
-            "base_url": self.llm_base_url,
-            "temperature": self.temperature,
-        }
+        if self._llm_settings is None:
+            self._llm_settings = MappingProxyType(
+                {
+                    "api_key": self.llm_api_key,
+                    "base_url": self.llm_base_url,
+                    "temperature": self.temperature,
+                }
+            )
+        return self._llm_settings
 
     def update(self, **kwargs: Any) -> None:
         """Update configuration with provided values."""
+        # Only declared settings; hasattr would also accept methods and
+        # pydantic internals
+        fields = type(self).model_fields
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in fields:
                 setattr(self, key, value)
+        self._llm_settings = None
+
+
+_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """Return the settings, loading .env and the environment on first use."""
+    global _config
+    if _config is None:
+        load_dotenv()
+        _config = Config()
+    return _config
+
+
+class _LazyConfig:
+    """Stand-in for the Config instance that builds it on first attribute use."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_config(), name, value)
 
 
-# Global config instance
-config = Config()
+# Global config instance; importing this module does not read .env or the
+# environment, so commands that never touch settings do not pay for it.
+config = _LazyConfig()
 
 
 # Validation
@@ -1,20 +1,62 @@
 """Module for creating Gemini language model clients."""
 
+import functools
+
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from config import config
 
 
-def create_gemini_client():
+def setup_llm_caching():
     """
-    Create a new Gemini language model instance using the ChatGoogleGenerativeAI client.
+    Install the global LangChain LLM cache.
 
-    This function reads configuration settings and initializes the Gemini client.
+    Identical prompts (same messages, tools and model parameters) are answered
+    from the cache instead of issuing a new Gemini request. Uses SQLite when
+    LLM_CACHE_PATH is set so hits survive restarts, otherwise an in-memory cache
+    holding the LLM_CACHE_MAXSIZE most recent entries.
     """
-    settings = config.get_llm_settings()
+    if not config.LLM_CACHE_ENABLED or get_llm_cache() is not None:
+        return
+
+    if config.LLM_CACHE_PATH:
+        from langchain_community.cache import SQLiteCache
+
+        set_llm_cache(SQLiteCache(database_path=config.LLM_CACHE_PATH))
+    else:
+        set_llm_cache(InMemoryCache(maxsize=config.LLM_CACHE_MAXSIZE))
 
+
+@functools.lru_cache(maxsize=4)
+def _cached_client(
+    model: str, temperature: float, api_key: str, max_output_tokens: int = None
+):
+    """One client per distinct model and settings; clients are stateless"""
     return ChatGoogleGenerativeAI(
-        model=settings.get("model", "gemini-1.5-flash"),
-        temperature=settings.get("temperature", 0.7),
-        google_api_key=settings.get("api_key"),
+        model=model,
+        temperature=temperature,
+        google_api_key=api_key,
+        max_output_tokens=max_output_tokens,
+    )
+
+
+def create_gemini_client(model: str = None, max_output_tokens: int = None):
+    """
+    Get a Gemini language model instance using the ChatGoogleGenerativeAI client.
+
+    This function reads configuration settings and returns the Gemini client for
+    them, using model instead of the configured default when given and capping
+    each response at max_output_tokens when it is set. Clients are
+    shared, so repeated calls with the same settings skip transport and
+    credential setup.
+    """
+    settings = config.get_llm_settings()
+
+    return _cached_client(
+        model or settings.get("model", "gemini-1.5-flash"),
+        settings.get("temperature", 0.7),
+        settings.get("api_key"),
+        max_output_tokens or None,
     )
@@ -1,60 +1,101 @@
 import asyncio
-import json
+import logging
 import sys
-from contextlib import contextmanager
-from typing import Any, Dict
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
 
-import uvicorn
 from config import config, validate_llm_config, validate_slack_config
-from fastapi import FastAPI, HTTPException, Request
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.prebuilt import create_react_agent
-from llms.gemini import create_gemini_client
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from models import Alert
-from prompts.analyst_prompt import ANALYST_SYSTEM_PROMPT
-from utils.search_tool import get_analysis_tools
+from pydantic import ValidationError
+from utils.batching import MicroBatcher
+from utils.cache import (
+    InflightCoalescer,
+    TTLCache,
+    alert_fingerprint,
+    plan_fingerprint,
+)
+from utils.ids import new_uuid
+from utils.json_utils import loads
+from utils.logger import setup_logging
 from utils.slack_events import SlackEventHandler
 from utils.slack_service import SlackService
 
-from agents.analyst_agent import AnalystAgent
-from agents.executor_agent import ExecutorAgent
-from agents.planner_agent import PlannerAgent
+logger = logging.getLogger(__name__)
 
 
-@contextmanager
-def lifespan(app: FastAPI):
+def start_slack(app: FastAPI):
+    """Connect the Slack service and store it and its event handler on app.state"""
+    slack_service = SlackService()
+    slack_event_handler = SlackEventHandler(
+        slack_service.socket_client, slack_service.web_client
+    )
+    slack_event_handler.register_button_handler(
+        "approve", slack_service.handle_button_click
+    )
+    slack_event_handler.register_button_handler(
+        "reject", slack_service.handle_button_click
+    )
+    slack_event_handler.register_button_handler(
+        "details", slack_service.handle_button_click
+    )
+    slack_service.start()
+    if config.STARTUP_WARMUP:
+        # Opens the Web API connection and checks the token up front
+        slack_service.web_client.auth_test()
+    slack_service.socket_client.socket_mode_request_listeners.append(
+        slack_event_handler.handle_event
+    )
+    app.state.slack_service = slack_service
+    app.state.slack_event_handler = slack_event_handler
+    logger.info("Slack service initialized successfully")
+
+
+async def warm_agents():
+    """Start kubectl-ai and build the shared agents ahead of the first alert.
+
+    With STARTUP_WARMUP set, a one-word prompt also opens the Gemini
+    connection, so the first alert does not pay for the handshake.
+    """
+    started = time.perf_counter()
+    try:
+        await get_agents()
+        logger.info("Agents and MCP tools initialized successfully")
+        if config.STARTUP_WARMUP:
+            from llms.gemini import create_gemini_client
+
+            # A shallow copy shares the client's transport; with the LLM cache
+            # off, the ping always reaches Gemini, even after a restart with a
+            # persistent cache that already holds the answer
+            llm = create_gemini_client().model_copy(update={"cache": False})
+            await llm.ainvoke("ping")
+    except Exception as e:
+        logger.error(f"Startup warm-up failed, retrying on first alert: {e}")
+        return
+    logger.info(f"Startup warm-up took {time.perf_counter() - started:.2f}s")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """Lifespan context for FastAPI startup and shutdown"""
     # Startup
+    setup_logging()
     try:
         validate_llm_config()
         validate_slack_config()
-        slack_service = SlackService()
-        slack_event_handler = SlackEventHandler(
-            slack_service.socket_client, slack_service.web_client
-        )
-        slack_event_handler.register_button_handler(
-            "approve", slack_service.handle_button_click
-        )
-        slack_event_handler.register_button_handler(
-            "reject", slack_service.handle_button_click
-        )
-        slack_event_handler.register_button_handler(
-            "details", slack_service.handle_button_click
-        )
-        slack_service.start()
-        slack_service.socket_client.socket_mode_request_listeners.append(
-            slack_event_handler.handle_event
-        )
-        app.state.slack_service = slack_service
-        app.state.slack_event_handler = slack_event_handler
-        print("Slack service initialized successfully")
+        # The blocking Slack connect runs in a thread while the agents and
+        # MCP server start on the event loop
+        await asyncio.gather(asyncio.to_thread(start_slack, app), warm_agents())
     except Exception as e:
-        print(f"Failed to initialize Slack service: {e}")
+        logger.error(f"Failed to initialize Slack service: {e}")
         raise
     try:
         yield
     finally:
         # Shutdown
+        await close_tools()
         slack_service = getattr(app.state, "slack_service", None)
         if slack_service:
             slack_service.stop()
@@ -62,35 +103,124 @@ def lifespan(app: FastAPI):
 
 app = FastAPI(lifespan=lifespan)
 
+# Compiled agent graphs shared by every incident, built on first use.
+_agents: Optional[Dict[str, Any]] = None
+_agents_lock = asyncio.Lock()
+
+# Agent toolset and the kubectl-ai session behind it, started once per process.
+_tools: Optional[list] = None
+_mcp_session = None
+_tools_lock = asyncio.Lock()
+
+# Status and outcome of webhook incidents by id, for polling; built on first
+# use so importing the app does not load the configuration.
+_incidents: Optional[TTLCache] = None
+
 
-@app.post("/webhook")
-async def alertmanager_webhook(alert_payload: Alert, request: Request):
+def get_incidents() -> TTLCache:
+    """Get the incident records, kept for INCIDENT_RETENTION_SECONDS"""
+    global _incidents
+    if _incidents is None:
+        _incidents = TTLCache(
+            maxsize=config.INCIDENT_RETENTION_SIZE,
+            ttl=config.INCIDENT_RETENTION_SECONDS,
+        )
+    return _incidents
+
+
+# Webhook payloads are untrusted and always validated; the validator is bound
+# once rather than looked up on the model class for every request.
+_validate_alert = Alert.model_validate_json
+
+
+@app.post("/webhook", status_code=202)
+async def alertmanager_webhook(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    force_refresh: bool = False,
+):
     """Handle Alertmanager webhook events.
 
+    The incident is processed in the background so Alertmanager gets an
+    immediate answer instead of retrying while the agents are still running.
+
     Args:
-        alert_payload (Alert): The alert payload from Alertmanager.
-        request (Request): The FastAPI request object.
+        request (Request): The FastAPI request object carrying the Alertmanager
+            alert payload.
+        background_tasks (BackgroundTasks): Tasks run after the response is sent.
+        force_refresh (bool): Re-run analysis and planning even if cached.
 
     Returns:
-        dict: The response from the webhook handling.
+        dict: The accepted status and the id to poll at /incident/{incident_id}.
     """
-    print(
-        f"Received Alertmanager webhook: {json.dumps(alert_payload.model_dump(), indent=2)}"
+    # Validate straight from the raw bytes with pydantic's JSON parser instead
+    # of decoding to Python objects with the stdlib json module first
+    body = await request.body()
+    try:
+        alert_payload = _validate_alert(body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+    # Dump the model once; every later stage works on the plain dict
+    alert_data = alert_payload.model_dump()
+    logger.info(
+        f"Received Alertmanager webhook: {alert_payload.labels.alertname} "
+        f"({alert_payload.status.value})"
     )
-    slack_service = request.app.state.slack_service
+    # The raw body is the payload as received; no need to encode it again
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Alertmanager payload: {body.decode()}")
+    incident_id = new_uuid()
+    get_incidents().set(incident_id, {"status": "processing"})
+    background_tasks.add_task(
+        process_incident,
+        incident_id,
+        alert_data,
+        request.app.state.slack_service,
+        force_refresh,
+    )
+    return {"status": "accepted", "incident_id": incident_id}
+
+
+@app.get("/incident/{incident_id}")
+async def get_incident(incident_id: str):
+    """Return the processing status and result of an incident.
+
+    Records expire INCIDENT_RETENTION_SECONDS after their last update, after
+    which the incident is reported as not found.
+    """
+    incident = get_incidents().get(incident_id)
+    if incident is None:
+        raise HTTPException(status_code=404, detail="Incident not found")
+    return {"incident_id": incident_id, **incident}
+
+
+async def process_incident(
+    incident_id: str, alert_data: dict, slack_service, force_refresh: bool = False
+):
+    """
+    Run the multi-agent system for an incident and record the outcome.
+
+    Args:
+        incident_id (str): Id under which the outcome is stored.
+        alert_data (dict): The alert being handled.
+        slack_service (SlackService): Service used for notifications and approval.
+        force_refresh (bool): Re-run analysis and planning even if cached.
+    """
     try:
         # Run the multi-agent system with Slack integration
         result = await run_multi_agent_system_with_slack(
-            alert_payload.model_dump(), slack_service
+            alert_data, slack_service, force_refresh=force_refresh
         )
-        return {"status": "success", "result": result}
+        get_incidents().set(incident_id, {"status": result["status"], "result": result})
     except Exception as e:
-        print(f"Error processing incident: {e}")
+        logger.error(f"Error processing incident: {e}")
+        get_incidents().set(incident_id, {"status": "error", "message": str(e)})
         if slack_service:
-            slack_service.send_error_notification(
-                str(e), f"Error processing alert: {alert_payload.labels.alertname}"
+            await asyncio.to_thread(
+                slack_service.send_error_notification,
+                str(e),
+                f"Error processing alert: {alert_data['labels']['alertname']}",
             )
-        return {"status": "error", "message": str(e)}, 500
 
 
 @app.post("/slack/events")
@@ -104,8 +234,8 @@ async def slack_events(request: Request):
     if not slack_service.verify_signature(body.decode(), headers):
         raise HTTPException(status_code=401, detail="Invalid signature")
 
-    # Handle URL verification
-    data = await request.json()
+    # Handle URL verification; decode the body already read for the signature
+    data = loads(body) if body else {}
     if data.get("type") == "url_verification":
         return {"challenge": data.get("challenge")}
 
@@ -122,74 +252,276 @@ def load_alert_from_file(file_path: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Alert data as a dictionary.
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        return loads(f.read())
+
+
+async def get_tools() -> list:
+    """
+    Get the shared agent toolset, starting the kubectl-ai MCP server on first use.
+
+    Returns:
+        list: The MCP kubectl tools and initial_snapshot, followed by the search
+            and analysis tools.
+    """
+    global _tools, _mcp_session
+    if _tools is None:
+        async with _tools_lock:
+            if _tools is None:
+                from langchain_mcp_adapters.client import MultiServerMCPClient
+                from utils.mcp import PersistentMCPSession, initial_snapshot_tool
+                from utils.search_tool import get_analysis_tools
+
+                mcp_client = MultiServerMCPClient(
+                    {
+                        "kubectl-ai": {
+                            "command": "kubectl-ai",
+                            "args": ["--mcp-server"],
+                            "transport": "stdio",
+                        },
+                    }
+                )
+                # One long-lived kubectl-ai process instead of one per tool call
+                mcp_session = PersistentMCPSession(mcp_client, "kubectl-ai")
+                tools_mcp = await mcp_session.start()
+                kubectl = next((t for t in tools_mcp if t.name == "kubectl"), None)
+                if kubectl is not None:
+                    tools_mcp.append(initial_snapshot_tool(kubectl))
+                _mcp_session = mcp_session
+                _tools = tools_mcp + get_analysis_tools()
+    return _tools
+
+
+async def close_tools():
+    """Stop the kubectl-ai MCP server started by get_tools()"""
+    global _tools, _mcp_session
+    if _mcp_session is not None:
+        await _mcp_session.stop()
+        _tools = _mcp_session = None
+
+
+async def get_agents() -> Dict[str, Any]:
+    """
+    Get the shared agent instances, building them on first use.
+
+    The LLM client, MCP toolset and compiled agent graphs are stateless between
+    invocations, so they are created once and reused for every incident.
+
+    Returns:
+        Dict[str, Any]: Agents keyed by role ("analyst", "planner", "executor")
+            plus the "analysis_batcher" and "plan_batcher" shared by concurrent
+            incidents, the "analysis_cache" of recent results and
+            "analysis_inflight" runs by alert fingerprint, the "plan_cache" of
+            recent plans. A "light_analysis_batcher" is added when LIGHT_LLM_MODEL is set.
+    """
+    global _agents
+    if _agents is None:
+        async with _agents_lock:
+            if _agents is None:
+                # Heavy LLM and agent imports are only paid on first use
+                from llms.gemini import create_gemini_client, setup_llm_caching
+
+                from agents.analyst_agent import AnalystAgent
+                from agents.executor_agent import ExecutorAgent
+                from agents.planner_agent import PlannerAgent
+
+                setup_llm_caching()
+                llm = create_gemini_client()
+
+                tools = await get_tools()
+
+                # One client serves single and packed analyses, so its output
+                # cap leaves room for a full pack
+                analyst_max_tokens = config.ANALYSIS_MAX_OUTPUT_TOKENS * max(
+                    config.ANALYSIS_PACK_SIZE, 1
+                )
+                analyst_llm = create_gemini_client(max_output_tokens=analyst_max_tokens)
+                analyst_agent = AnalystAgent(analyst_llm, tools=tools, debug=False)
+                planner_agent = PlannerAgent(llm, tools=tools, debug=False)
+                _agents = {
+                    "analyst": analyst_agent,
+                    "planner": planner_agent,
+                    "executor": ExecutorAgent(llm, tools=tools, debug=False),
+                    # Coalesces analyses of alerts arriving close together
+                    "analysis_batcher": MicroBatcher(
+                        analyst_agent.abatch,
+                        max_size=config.BATCH_MAX_SIZE,
+                        window_ms=config.BATCH_WINDOW_MS,
+                    ),
+                    # Coalesces plans for incidents diagnosed close together;
+                    # each incident gets its plan as soon as it is generated
+                    "plan_batcher": MicroBatcher(
+                        planner_agent.astream_batch,
+                        max_size=config.BATCH_MAX_SIZE,
+                        window_ms=config.PLAN_BATCH_WINDOW_MS,
+                    ),
+                    "analysis_cache": TTLCache(
+                        maxsize=config.ANALYSIS_CACHE_SIZE,
+                        ttl=config.ANALYSIS_CACHE_TTL,
+                    ),
+                    "analysis_inflight": InflightCoalescer(),
+                    "plan_cache": TTLCache(
+                        maxsize=config.PLAN_CACHE_SIZE, ttl=config.PLAN_CACHE_TTL
+                    ),
+                }
+                if config.LIGHT_LLM_MODEL:
+                    light_analyst = AnalystAgent(
+                        create_gemini_client(
+                            config.LIGHT_LLM_MODEL,
+                            max_output_tokens=analyst_max_tokens,
+                        ),
+                        tools=tools,
+                        debug=False,
+                    )
+                    _agents["light_analysis_batcher"] = MicroBatcher(
+                        light_analyst.abatch,
+                        max_size=config.BATCH_MAX_SIZE,
+                        window_ms=config.BATCH_WINDOW_MS,
+                    )
+    return _agents
+
+
+async def analyze_alert(agents: Dict[str, Any], alert_data: dict) -> dict:
+    """
+    Analyze an alert, trying the light model first for informational alerts.
+
+    Args:
+        agents (Dict[str, Any]): The shared agents from get_agents().
+        alert_data (dict): The alert to analyze.
+
+    Returns:
+        dict: The analysis result.
+    """
+    light_batcher = agents.get("light_analysis_batcher")
+    labels = alert_data.get("labels") or {}
+    if light_batcher is not None and labels.get("severity") == "info":
+        try:
+            result = await light_batcher.submit(alert_data)
+            confidence = str(result.get("confidence_level", "")).lower()
+            if "error" not in result and confidence != "low":
+                return result
+        except Exception as e:
+            logger.warning(f"Light model analysis failed: {e}")
+        logger.info("⬆️ Escalating analysis to the default model")
+    return await agents["analysis_batcher"].submit(alert_data)
+
+
+async def plan_remediation(
+    agents: Dict[str, Any],
+    alert_data: dict,
+    analysis_result: dict,
+    force_refresh: bool = False,
+) -> dict:
+    """
+    Get a remediation plan for an analyzed alert, reusing a recent one if cached.
+
+    Args:
+        agents (Dict[str, Any]): The shared agents from get_agents().
+        alert_data (dict): The alert being remediated.
+        analysis_result (dict): The analysis of the alert.
+        force_refresh (bool): Generate a new plan even if one is cached.
+
+    Returns:
+        dict: The remediation plan.
+    """
+    plan_key = plan_fingerprint(alert_data, analysis_result)
+    # Plans are read-only once generated, so a cached plan is shared by
+    # every incident reusing it, like cached analyses, instead of copied
+    plan = None if force_refresh else agents["plan_cache"].get(plan_key)
+    if plan is not None:
+        logger.info("♻️ Reusing plan for the same alert and root cause")
+        return plan
+
+    logger.info("📋 Generating remediation plan...")
+    # Incidents from one analysis batch reach planning together
+    plan = await agents["plan_batcher"].submit((analysis_result, alert_data))
+    if config.PLAN_CACHE_TTL > 0 and "error" not in plan:
+        agents["plan_cache"].set(plan_key, plan)
+    return plan
 
 
 # TODO: Use Supervisor Agent
 # Logic send, approval from Slack move to tools
 # Supervisor will use tool to do the flow
-async def run_multi_agent_system_with_slack(alert_data: dict, slack_service):
+async def run_multi_agent_system_with_slack(
+    alert_data: dict, slack_service, force_refresh: bool = False
+):
     """Run the multi-agent system with Slack integration"""
     if not slack_service:
         raise ValueError("SlackService instance is required for this function")
 
-    llm = create_gemini_client()
-
-    mcp_client = MultiServerMCPClient(
-        {
-            "kubectl-ai": {
-                "command": "kubectl-ai",
-                "args": ["--mcp-server"],
-                "transport": "stdio",
-            },
-        }
-    )
-    tools_mcp = await mcp_client.get_tools()
-    tools = tools_mcp + get_analysis_tools()
+    # Nothing to diagnose or remediate once Alertmanager reports recovery
+    if alert_data.get("status") == "resolved":
+        logger.info("✅ Alert already resolved - skipping analysis")
+        return {"status": "skipped", "reason": "alert_resolved"}
 
-    # Initialize agents
-    analyst_agent = AnalystAgent(llm, tools=tools, debug=False)
-    planner_agent = PlannerAgent(llm, tools=tools, debug=False)
-    executor_agent = ExecutorAgent(llm, tools=tools, debug=False)
+    agents = await get_agents()
 
     try:
         # Step 1: Run analysis
-        print("🔍 Running analysis...")
-        analysis_result = analyst_agent.run(alert_data)
-
-        # Send analysis result to Slack
-        slack_service.send_analysis_result(alert_data, analysis_result)
-        print("✅ Analysis result sent to Slack")
-
-        # Step 2: Generate remediation plan
-        print("📋 Generating remediation plan...")
-        plan = planner_agent.run(analysis_result, alert_data)
+        fingerprint = alert_fingerprint(alert_data)
+        analysis_result = (
+            None if force_refresh else agents["analysis_cache"].get(fingerprint)
+        )
+        if analysis_result is not None:
+            logger.info("♻️ Reusing analysis of an identical recent alert")
+        else:
+            logger.info("🔍 Running analysis...")
+            # Identical alerts arriving together wait on the same analysis
+            analysis_result = await agents["analysis_inflight"].run(
+                fingerprint, lambda: analyze_alert(agents, alert_data)
+            )
+            if config.ANALYSIS_CACHE_TTL > 0 and "error" not in analysis_result:
+                agents["analysis_cache"].set(fingerprint, analysis_result)
+
+        # Step 2: Send analysis result to Slack while the remediation plan is
+        # generated; the plan is only sent once both are done, so the
+        # analysis message still comes first
+        _, plan = await asyncio.gather(
+            asyncio.to_thread(
+                slack_service.send_analysis_result, alert_data, analysis_result
+            ),
+            plan_remediation(agents, alert_data, analysis_result, force_refresh),
+        )
+        logger.info("✅ Analysis result sent to Slack")
 
         # Send plan to Slack and request approval
-        approval_id = slack_service.send_remediation_plan(alert_data, plan)
-        print(f"📋 Remediation plan sent to Slack (Approval ID: {approval_id})")
+        approval_id = await asyncio.to_thread(
+            slack_service.send_remediation_plan, alert_data, plan
+        )
+        logger.info(f"📋 Remediation plan sent to Slack (Approval ID: {approval_id})")
 
         # Wait for approval
-        print("⏳ Waiting for Slack approval...")
-        approval_result = slack_service.wait_for_approval(approval_id)
+        logger.info("⏳ Waiting for Slack approval...")
+        approval_result, approved_by = await slack_service.await_approval(approval_id)
 
         if approval_result is None:
-            print("⏰ Approval timeout - cancelling execution")
+            logger.warning("⏰ Approval timeout - cancelling execution")
             return {"status": "cancelled", "reason": "approval_timeout"}
         elif not approval_result:
-            print("❌ Plan rejected - cancelling execution")
+            logger.warning("❌ Plan rejected - cancelling execution")
             return {"status": "cancelled", "reason": "plan_rejected"}
         else:
-            print("✅ Plan approved - proceeding with execution")
+            logger.info("✅ Plan approved - proceeding with execution")
 
         # Step 3: Execute the plan
-        print("🚀 Executing remediation plan...")
-        execution_result = executor_agent.run(plan, alert_data)
+        logger.info("🚀 Executing remediation plan...")
+        reported_steps = 0
+        async for execution_result in agents["executor"].astream(
+            plan, alert_data, analysis_result, authorized_by=approved_by
+        ):
+            steps = (
+                execution_result.get("executed_steps")
+                if isinstance(execution_result, dict)
+                else None
+            )
+            if isinstance(steps, list) and len(steps) > reported_steps:
+                reported_steps = len(steps)
+                logger.info(f"🚀 Reporting on step {reported_steps}...")
 
         # Send execution result to Slack
-        slack_service.send_execution_result(execution_result)
-        print("✅ Execution result sent to Slack")
+        await asyncio.to_thread(slack_service.send_execution_result, execution_result)
+        logger.info("✅ Execution result sent to Slack")
 
         return {
             "analysis": analysis_result,
@@ -200,57 +532,50 @@ async def run_multi_agent_system_with_slack(alert_data: dict, slack_service):
 
     except Exception as e:
         error_msg = f"Error in multi-agent system: {str(e)}"
-        print(f"❌ {error_msg}")
-        slack_service.send_error_notification(error_msg, "Multi-agent system error")
+        logger.error(f"❌ {error_msg}")
+        await asyncio.to_thread(
+            slack_service.send_error_notification,
+            error_msg,
+            "Multi-agent system error",
+        )
 
         raise
 
 
-async def run_multi_agent_system(alert_data: dict):
-    """Original multi-agent system without Slack integration"""
-    llm = create_gemini_client()
-
-    mcp_client = MultiServerMCPClient(
-        {
-            "kubectl-ai": {
-                "command": "kubectl-ai",
-                "args": ["--mcp-server"],
-                "transport": "stdio",
-            },
-        }
-    )
-    tools_mcp = await mcp_client.get_tools()
-    tools = tools_mcp + get_analysis_tools()
-
-    agent = create_react_agent(
-        model=llm,
-        tools=tools,
-        prompt=ANALYST_SYSTEM_PROMPT,
-        name="analyst_agent",
-    )
-
-    for step in agent.stream(
-        {"messages": [{"role": "user", "content": f"Incident alert: {alert_data}"}]},
-        stream_mode="values",
-    ):
-        print(step["messages"][-1].pretty_print())
+async def run_from_cli(alert_data: dict, slack_service):
+    """Run one alert through the agents, then stop the kubectl-ai MCP server"""
+    try:
+        return await run_multi_agent_system_with_slack(alert_data, slack_service)
+    finally:
+        await close_tools()
 
 
 def main():
     """Main function to run the multi-agent system or start the FastAPI server"""
+    setup_logging()
     if len(sys.argv) > 1 and sys.argv[1] == "serve":
-        print("Starting FastAPI webhook server with Slack integration...")
-        uvicorn.run(app, host=config.HOST, port=config.PORT)
+        import uvicorn
+
+        logger.info("Starting FastAPI webhook server with Slack integration...")
+        # "auto" picks uvloop and httptools when they are installed
+        uvicorn.run(
+            "main:app" if config.WORKERS > 1 else app,
+            host=config.HOST,
+            port=config.PORT,
+            workers=config.WORKERS,
+            loop="auto",
+            http="auto",
+        )
     else:
         if len(sys.argv) > 1:
             alert_file = sys.argv[1]
         else:
             alert_file = "examples/alerts/node-down.json"
-        print(f"Processing alert from file: {alert_file}")
+        logger.info(f"Processing alert from file: {alert_file}")
         alert_data = load_alert_from_file(alert_file)
         # For CLI, we don't use app.state, so create a SlackService instance directly
         slack_service = SlackService()
-        asyncio.run(run_multi_agent_system_with_slack(alert_data, slack_service))
+        asyncio.run(run_from_cli(alert_data, slack_service))
 
 
 if __name__ == "__main__":
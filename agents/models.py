@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Dict, Optional
 from datetime import datetime
 from enum import Enum
@@ -16,6 +17,9 @@ class AlertSeverity(str, Enum):
 
 
 class AlertLabels(BaseModel):
+    # Alerts are read-only once received
+    model_config = ConfigDict(frozen=True)
+
     alertname: str
     severity: AlertSeverity
     node: Optional[str] = None
@@ -25,16 +29,29 @@ class AlertLabels(BaseModel):
     service: Optional[str] = None
     deployment: Optional[str] = None
 
+    # The same few names repeat across every alert of a storm; intern them so
+    # alerts held in caches and batches share one copy of each
+    @field_validator(
+        "alertname", "node", "namespace", "container", "service", "deployment"
+    )
+    @classmethod
+    def intern_label(cls, value: Optional[str]) -> Optional[str]:
+        return sys.intern(value) if value else value
+
     def __getitem__(self, key):
         return getattr(self, key)
 
 
 class AlertAnnotations(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     summary: str
     description: str
 
 
 class Alert(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     status: AlertStatus
     labels: AlertLabels
     annotations: AlertAnnotations
@@ -44,6 +61,8 @@ class Alert(BaseModel):
 
 
 class AlertGroup(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     receiver: str
     status: AlertStatus
     alerts: List[Alert]
@@ -26,6 +26,8 @@ You have access to specialized MCP (Model Context Protocol) servers providing re
   - `modifies_resource`: Whether the command modifies resources ("yes"/"no"/"unknown")
   - Useful for system diagnostics, file operations, and complex command chains
 
+- `initial_snapshot()`: Runs `kubectl cluster-info`, `kubectl get nodes -o wide`, non-running pods and recent events concurrently and returns them together
+
 *Web Research Tools:*
 - `web_search(query)`: Search for Kubernetes troubleshooting guides and error solutions
 - `web_fetch(url)`: Retrieve specific documentation or knowledge base articles
@@ -95,42 +97,10 @@ Always structure your analysis to include:
 - **Evidence Chain**: Document how each kubectl command output contributes to your diagnostic conclusion
 - **Resource Relationships**: Use labels and selectors to trace relationships between resources
 
-**Common Diagnostic Command Patterns:**
-
-**Initial Assessment:**
-```bash
-kubectl cluster-info
-kubectl get nodes -o wide
-kubectl get pods --all-namespaces --field-selector=status.phase!=Running
-kubectl get events --all-namespaces --sort-by='.lastTimestamp' | tail -20
-```
-
-**Deep Dive Investigation:**
-```bash
-kubectl describe pod <pod-name> -n <namespace>
-kubectl logs <pod-name> -n <namespace> --previous
-kubectl get events --field-selector involvedObject.name=<resource-name>
-kubectl get <resource> -o yaml
-```
-
-**Performance Analysis:**
-```bash
-kubectl top nodes
-kubectl top pods --all-namespaces --sort-by=memory
-kubectl describe node <node-name>
-```
-
-**Storage and Networking:**
-```bash
-kubectl get pv,pvc --all-namespaces
-kubectl get services,ingress --all-namespaces
-kubectl get networkpolicies --all-namespaces
-```
-
 ---
 
 **Investigation Workflow:**
-1. Execute broad health checks to establish baseline
+1. Call `initial_snapshot` to establish the baseline in one step
 2. Focus on failing or degraded components
 3. Gather detailed information about problematic resources
 4. Analyze logs and events for error patterns
@@ -139,12 +109,11 @@ kubectl get networkpolicies --all-namespaces
 7. Synthesize findings into root cause analysis
 """
 
+# Static instructions come first and the alert last, so every analysis shares
+# the same prompt prefix and can hit the provider's prefix cache.
 ANALYST_HUMAN_PROMPT = """
-**INCIDENT ALERT FOR DIAGNOSIS:**
-{alert_data}
-
 **Analysis Request:**
-Perform a comprehensive diagnostic analysis of this alert using your systematic protocol. Utilize the available diagnostic tools to gather evidence and provide a thorough root cause analysis.
+Perform a comprehensive diagnostic analysis of the alert below using your systematic protocol. Utilize the available diagnostic tools to gather evidence and provide a thorough root cause analysis.
 
 **Expected Deliverables:**
 - Root cause identification with supporting evidence
@@ -154,20 +123,46 @@ Perform a comprehensive diagnostic analysis of this alert using your systematic
 - Confidence level in your diagnosis
 - Immediate action recommendations if critical
 
-The final output is JSON formatted with the following keys:
-
-- "root_cause": "Identified root cause of the incident",
-- "confidence_level": "High/Medium/Low",
-- "severity": "Critical/Major/Minor",
-- "affected_components": ["list", "of", "components"],
-- "investigation_summary": "Detailed summary of the investigation process",
-- "recommendations": ["Immediate action steps", "for remediation"]
-
-```
+The final analysis is a JSON object in the output format given in your instructions.
 
 **IMPORTANT:**
 - Ensure your plan is short, concise, and focused on the root cause. Avoid unnecessary verbosity.
 - Limit character count to 2000 characters for the entire response.
 
 Please follow your diagnostic protocol and use the required output format for your analysis results.
+
+**Suggested kubectl Commands:**
+{cookbook}
+
+**INCIDENT ALERT FOR DIAGNOSIS:**
+{alert_data}
+"""
+
+# Several alerts analyzed in one run; shares its instructions with the single
+# alert prompt and keeps the alerts last for the same prefix-cache reason.
+ANALYST_BATCH_HUMAN_PROMPT = """
+**Analysis Request:**
+Perform a diagnostic analysis of each incident alert below using your systematic protocol. The alerts fired around the same time and may share a root cause, so gather evidence once where it applies to several of them. Utilize the available diagnostic tools and provide a root cause analysis for every incident.
+
+**Expected Deliverables (per incident):**
+- Root cause identification with supporting evidence
+- Severity level assessment and justification
+- Complete inventory of affected components
+- Detailed investigation summary with reasoning
+- Confidence level in your diagnosis
+- Immediate action recommendations if critical
+
+The final answer is a JSON object in the output format given in your instructions, with one analysis per incident whose "incident_id" is the id shown in INCIDENT [<id>].
+
+**IMPORTANT:**
+- Keep each analysis short, concise, and focused on the root cause. Avoid unnecessary verbosity.
+- Limit each analysis to 2000 characters.
+
+Please follow your diagnostic protocol and use the required output format for your analysis results.
+
+**Suggested kubectl Commands:**
+{cookbook}
+
+**INCIDENT ALERTS FOR DIAGNOSIS:**
+{alerts}
 """
@@ -0,0 +1,109 @@
+"""
+kubectl command cookbook for the Analyst Agent
+
+Only the snippets whose tags match an alert are added to its analysis prompt,
+instead of every snippet being sent with every analysis.
+"""
+
+import re
+from typing import Iterable
+
+# (title, tags, commands); the space-separated tags are matched against the
+# words of an alert's labels and annotations. The first snippet is used when
+# nothing matches.
+KUBECTL_COOKBOOK = (
+    (
+        "Initial Assessment",
+        "cluster apiserver etcd scheduler target down",
+        """kubectl cluster-info
+kubectl get nodes -o wide
+kubectl get pods --all-namespaces --field-selector=status.phase!=Running
+kubectl get events --all-namespaces --sort-by='.lastTimestamp' | tail -20""",
+    ),
+    (
+        "Pod Failures",
+        (
+            "pod container crash looping restart restarts oom killed image pull back "
+            "off backoff pending terminated not ready probe"
+        ),
+        """kubectl describe pod <pod-name> -n <namespace>
+kubectl logs <pod-name> -n <namespace> --previous
+kubectl get events -n <namespace> --field-selector involvedObject.name=<pod-name>
+kubectl get pod <pod-name> -n <namespace> -o yaml""",
+    ),
+    (
+        "Workload Rollouts",
+        (
+            "deployment replicas replica set mismatch rollout generation stateful "
+            "daemon job hpa scaling unavailable"
+        ),
+        """kubectl get deployment,statefulset,daemonset -n <namespace>
+kubectl rollout status deployment/<name> -n <namespace>
+kubectl rollout history deployment/<name> -n <namespace>
+kubectl describe hpa -n <namespace>""",
+    ),
+    (
+        "Node Health",
+        "node kubelet unreachable pressure disk pid not ready cordoned unschedulable",
+        """kubectl describe node <node-name>
+kubectl get pods --all-namespaces --field-selector spec.nodeName=<node-name>
+kubectl top node <node-name>""",
+    ),
+    (
+        "Performance Analysis",
+        (
+            "cpu memory throttling usage high latency quota limit limits overcommit "
+            "saturation load"
+        ),
+        """kubectl top nodes
+kubectl top pods --all-namespaces --sort-by=memory
+kubectl describe resourcequota -n <namespace>""",
+    ),
+    (
+        "Storage",
+        "pv pvc volume persistent storage filesystem disk space inodes claim",
+        """kubectl get pv,pvc --all-namespaces
+kubectl describe pvc <claim-name> -n <namespace>
+kubectl get storageclass""",
+    ),
+    (
+        "Networking",
+        (
+            "service endpoint endpoints ingress network dns http errors 5xx connection "
+            "refused timeout certificate"
+        ),
+        """kubectl get services,endpoints,ingress -n <namespace>
+kubectl get networkpolicies --all-namespaces
+kubectl logs -n kube-system -l k8s-app=kube-dns --tail=50""",
+    ),
+)
+
+_TAGS = tuple(frozenset(tags.split()) for _, tags, _ in KUBECTL_COOKBOOK)
+
+# Snippets are rendered once here rather than on every analysis
+_RENDERED = tuple(
+    f"*{title}:*\n```bash\n{commands}\n```" for title, _, commands in KUBECTL_COOKBOOK
+)
+
+# Splits CamelCase alert names: KubePodCrashLooping -> Kube, Pod, Crash, Looping
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+[a-z]*")
+
+
+def _alert_words(alert_data: dict) -> set:
+    """Lowercased words of the alert's label and annotation values"""
+    text = " ".join(
+        str(value)
+        for section in ("labels", "annotations")
+        for value in (alert_data.get(section) or {}).values()
+    )
+    return {word.lower() for word in _WORD.findall(text)}
+
+
+def select_cookbook(alerts: Iterable[dict], limit: int = 3) -> str:
+    """Render the snippets whose tags best match the alerts, best match first"""
+    words = set().union(*map(_alert_words, alerts))
+    scores = [len(tags & words) for tags in _TAGS]
+    # sorted() is stable, so ties keep cookbook order
+    ranked = sorted(range(len(scores)), key=lambda i: -scores[i])
+    chosen = [i for i in ranked[:limit] if scores[i]] or [0]
+    return "\n\n".join(_RENDERED[i] for i in chosen)
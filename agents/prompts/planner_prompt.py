@@ -11,33 +11,7 @@ Design comprehensive, safe, and executable remediation plans for Kubernetes infr
 ---
 
 **Available Planning Tools:**
-You have access to specialized MCP (Model Context Protocol) servers and planning utilities:
-
-**K8s-MCP-Server Tools:**
-- `kubectl_get(resource, namespace, name)`: Verify current resource state before planning actions
-- `kubectl_describe(resource, namespace, name)`: Get detailed resource information for planning context
-- `kubectl_logs(pod_name, namespace, container, lines)`: Check current logs to validate planned actions
-- `kubectl_top(resource, namespace)`: Assess resource usage for capacity planning
-- `get_cluster_info()`: Verify cluster readiness for remediation actions
-- `get_node_status()`: Check node health for scheduling decisions
-- `get_events(namespace, field_selector)`: Review recent events to avoid conflicts
-- `kubectl_dry_run(resource, action)`: Test planned actions without execution
-
-**Prometheus-MCP-Server Tools:**
-- `prometheus_query(query)`: Validate current metrics before planning interventions
-- `get_active_alerts()`: Check for conflicting alerts that might affect remediation
-- `get_service_metrics(service_name, namespace)`: Baseline performance for recovery validation
-- `get_node_metrics(node_name)`: Assess node capacity for resource modifications
-- `get_pod_metrics(pod_name, namespace)`: Analyze resource requirements for scaling decisions
-
-**Planning & Documentation Tools:**
-- `get_kubectl_commands(resource_type)`: Retrieve standard kubectl commands for specific resources
-- `estimate_risk_level(action_list)`: Evaluate risk assessment for planned action sequences
-- `get_rollback_commands(resource_type, action)`: Generate safe rollback procedures
-- `estimate_execution_time(steps)`: Calculate realistic execution timelines
-- `search_k8s_docs(query)`: Reference official Kubernetes documentation and best practices
-- `validate_prerequisites(actions)`: Check dependencies and requirements
-- `generate_verification_steps(action)`: Create validation procedures for each action
+Use the tools provided with this conversation; their names and parameters are in the tool definitions. They are the kubectl-ai MCP server's `kubectl` and `bash` tools, each taking a `command` and a `modifies_resource` flag ("yes"/"no"/"unknown"), plus web search for Kubernetes documentation. Verify current state with read-only commands and test changes with `--dry-run=server` before putting them in a plan.
 
 ---
 
@@ -114,45 +88,57 @@ For each step, provide:
 
 ---
 
-**Critical Planning Principles:**
-
-- **Safety First**: Every action must have a validated rollback procedure
-- **Incremental Approach**: Break complex remediation into smaller, manageable steps
-- **Validation Gates**: Require verification before proceeding to next step
-- **State Awareness**: Use MCP tools to verify current state before each action
-- **Risk Mitigation**: Prioritize reversible actions and minimal blast radius
+**Operating Principles:**
+- **Safety First**: Every action has a validated rollback procedure; prefer reversible actions with minimal blast radius
+- **Incremental Steps**: Break complex remediation into small steps with a verification gate between them
+- **Verify Current State**: Check resources, metrics and conflicting alerts or operations with the tools before planning each action
+- **Dry-Run First**: Validate command syntax and parameters with dry-run where possible
+- **Capacity and Prerequisites**: Confirm resources and dependencies are available within the planned timeframe
 - **Time Boxing**: Set realistic time limits with buffer for unexpected issues
-- **Escalation Ready**: Define clear escalation criteria and procedures
-- **Documentation**: Maintain audit trail of all planned actions and rationale
-
-**MCP Integration Guidelines:**
-- **Real-Time Validation**: Use MCP tools to verify current system state
-- **Dry-Run First**: Always test commands with dry-run where possible
-- **Metric Baselines**: Establish current performance baselines for comparison
-- **Conflict Detection**: Check for conflicting alerts or ongoing operations
-- **Capacity Planning**: Verify resource availability before scaling actions
-- **State Correlation**: Cross-reference Kubernetes state with Prometheus metrics
-- **Continuous Monitoring**: Plan for real-time monitoring during execution
-
-**Quality Assurance:**
-- Validate all commands for syntax and parameter correctness
-- Ensure rollback procedures are tested and documented
-- Verify prerequisites can be met within planned timeframe
-- Confirm monitoring coverage for all affected components
-- Test communication channels and escalation procedures
+- **Escalation Ready**: Define clear escalation criteria and monitoring for the execution
+- **Documentation**: Record the rationale for every planned action
 """
 
+# Static instructions come first and the incident data last, so every plan
+# request shares the same prompt prefix and can hit the provider's prefix cache.
 PLANNER_HUMAN_PROMPT = """
+**Planning Request:**
+Based on the diagnostic analysis below, create a comprehensive, safe, and executable remediation plan. Use the available MCP server tools to validate current system state and ensure all planned actions are feasible.
+
+**Required Deliverables:**
+- Complete remediation plan following the standardized format
+- Specific kubectl commands with dry-run validation
+- Comprehensive rollback procedures for each action
+- Risk assessment with mitigation strategies
+- Realistic execution timeline with milestones
+- Success criteria and validation procedures
+- Post-remediation monitoring plan
+
+**Planning Considerations:**
+- Verify current cluster state using MCP tools before finalizing actions
+- Ensure all commands are validated through dry-run where possible
+- Create phased approach with clear rollback points
+- Consider business impact and maintenance window requirements
+- Plan for real-time monitoring during execution
+- Include escalation procedures for unexpected scenarios
+- Record which earlier steps each step depends on so independent steps can run in parallel
+
+The final plan is a JSON object in the output format given in your instructions, with a dry-run command, rollback command, verification method and dependencies for every step.
+
+Please leverage the MCP servers to validate your plan and ensure it addresses the root cause identified in the diagnosis while maintaining system safety and reliability.
+
 **DIAGNOSTIC ANALYSIS RESULTS:**
 {analysis_result}
 
 **ORIGINAL INCIDENT ALERT:**
 {alert_data}
+"""
 
+PLANNER_BATCH_HUMAN_PROMPT = """
 **Planning Request:**
-Based on the diagnostic analysis, create a comprehensive, safe, and executable remediation plan. Use the available MCP server tools to validate current system state and ensure all planned actions are feasible.
+Create a comprehensive, safe, and executable remediation plan for each incident below, based on its diagnostic analysis. The incidents were diagnosed around the same time and may share affected components, so validate shared system state with the available MCP server tools once where it applies to several of them.
 
-**Required Deliverables:**
+**Required Deliverables (per incident):**
 - Complete remediation plan following the standardized format
 - Specific kubectl commands with dry-run validation
 - Comprehensive rollback procedures for each action
@@ -165,12 +151,12 @@ Based on the diagnostic analysis, create a comprehensive, safe, and executable r
 - Verify current cluster state using MCP tools before finalizing actions
 - Ensure all commands are validated through dry-run where possible
 - Create phased approach with clear rollback points
-- Consider business impact and maintenance window requirements
-- Plan for real-time monitoring during execution
-- Include escalation procedures for unexpected scenarios
+- Do not plan conflicting actions on the same resource for different incidents
+- Record which earlier steps each step depends on so independent steps can run in parallel
 
-The final output is JSON formatted with the following keys:
+The final output is a JSON object with a "plans" list holding one plan per incident, each with the following keys:
 
+- "incident_id": "The id shown in INCIDENT [<id>]",
 - "plan_id": "unique-plan-id",
 - "plan_name": "Descriptive Plan Title",
 - "description": "Comprehensive overview of the remediation plan",
@@ -190,11 +176,13 @@ The final output is JSON formatted with the following keys:
     - "estimated_duration": "Time allocation for this step",
     - "risk_level": "Individual step risk assessment",
     - "escalation_trigger": "When to halt and escalate"
+    - "depends_on": [Step numbers that must complete first; empty if independent]
     ...
 - "post_execution_validation_procedures": ["Final system health checks"],
 - "monitoring_plan": ["What to monitor post-remediation"],
 - "alert_adjustments": ["Any alert threshold modifications needed"],
 - "documentation_updates": ["Required procedure or runbook updates"]
 
-Please leverage the MCP servers to validate your plan and ensure it addresses the root cause identified in the diagnosis while maintaining system safety and reliability.
+**INCIDENTS FOR PLANNING:**
+{incidents}
 """
@@ -0,0 +1,31 @@
+"""
+Tests for the agent result cache keys
+"""
+
+from utils.cache import plan_fingerprint
+
+ANALYSIS = {"root_cause": "Disk pressure", "affected_components": ["kubelet"]}
+
+
+def _alert(**labels):
+    return {"labels": {"alertname": "KubeNodeNotReady", **labels}}
+
+
+def test_plan_fingerprint_differs_by_node():
+    assert plan_fingerprint(_alert(node="node-1"), ANALYSIS) != plan_fingerprint(
+        _alert(node="node-2"), ANALYSIS
+    )
+
+
+def test_plan_fingerprint_differs_by_namespace():
+    assert plan_fingerprint(_alert(namespace="payments"), ANALYSIS) != plan_fingerprint(
+        _alert(namespace="checkout"), ANALYSIS
+    )
+
+
+def test_plan_fingerprint_ignores_root_cause_wording():
+    reworded = {**ANALYSIS, "root_cause": "  disk   PRESSURE "}
+
+    assert plan_fingerprint(_alert(node="node-1"), ANALYSIS) == plan_fingerprint(
+        _alert(node="node-1"), reworded
+    )
@@ -0,0 +1,49 @@
+"""
+Tests for recovering agent JSON answers from LLM responses
+"""
+
+from utils.parsers import parse_llm_json
+
+
+def test_unfenced_answer_with_backticks_in_a_string():
+    text = (
+        '{"root_cause": "OOM", "investigation_summary": '
+        '"Ran ```kubectl get pods``` and saw OOMKilled"}'
+    )
+
+    assert parse_llm_json(text) == {
+        "root_cause": "OOM",
+        "investigation_summary": "Ran ```kubectl get pods``` and saw OOMKilled",
+    }
+
+
+def test_json_fence_preferred_over_an_earlier_bash_fence():
+    text = (
+        "I checked the pods first:\n"
+        "```bash\n"
+        "kubectl get pods -n default -o jsonpath={.items[*].status.phase}\n"
+        "```\n"
+        "Here is the analysis:\n"
+        "```json\n"
+        '{"root_cause": "OOM", "affected_components": ["api"]}\n'
+        "```"
+    )
+
+    assert parse_llm_json(text) == {
+        "root_cause": "OOM",
+        "affected_components": ["api"],
+    }
+
+
+def test_fenced_answer_with_backticks_in_a_string():
+    text = '```json\n{"investigation_summary": "Ran ```kubectl top pods```"}\n```'
+
+    assert parse_llm_json(text) == {
+        "investigation_summary": "Ran ```kubectl top pods```"
+    }
+
+
+def test_answer_within_prose_with_trailing_comma():
+    text = 'The analysis is {"root_cause": "OOM",} as requested.'
+
+    assert parse_llm_json(text) == {"root_cause": "OOM"}
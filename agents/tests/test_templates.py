@@ -0,0 +1,27 @@
+"""
+Tests for precompiled prompt templates
+"""
+
+import pytest
+
+from utils import compile_template
+
+
+def test_renders_like_str_format():
+    template = "Alert {alert}: {{literal}} {count} ({alert})"
+
+    render = compile_template(template)
+
+    assert render(alert="NodeDown", count=3, unused="x") == template.format(
+        alert="NodeDown", count=3
+    )
+
+
+def test_rejects_conversion():
+    with pytest.raises(ValueError):
+        compile_template("Alert {alert!r}")
+
+
+def test_rejects_format_spec():
+    with pytest.raises(ValueError):
+        compile_template("Count {count:>5}")
@@ -1,5 +1,63 @@
-from typing import Any, Callable
-import json
+import asyncio
+import functools
+import logging
+import string
+from typing import Any, AsyncIterator, Callable, List, Tuple, Type
+
+from config import config
+from langchain_core.messages import AIMessageChunk
+from langchain_core.utils.json import parse_json_markdown
+from pydantic import BaseModel, ValidationError
+from utils.history import trim_tool_output
+from utils.json_utils import clip_middle, dumps_shared
+from utils.parsers import get_format_instructions, parse_llm_json
+
+logger = logging.getLogger(__name__)
+
+# Characters of an unparseable answer kept for debugging
+RAW_RESULT_MAX_CHARS = 4000
+
+# Stream chunks containing one of these can change the shape of a partial answer
+_JSON_STRUCTURE_CHARS = frozenset("{}[]")
+
+
+@functools.lru_cache(maxsize=64)
+def compile_template(template: str) -> Callable[..., str]:
+    """Generate a function that fills a str.format template from keyword args.
+
+    The template is split once and emitted as a single join over its literal
+    and field parts, so rendering does no parsing or per-field branching.
+
+    Raises:
+        ValueError: For fields that are not plain names, or that use a
+            conversion or format spec, which the join would silently drop.
+    """
+    literals: List[str] = []
+    parts: List[str] = []
+    fields: List[str] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(f"_L{len(literals)}")
+            literals.append(literal)
+        if field is not None:
+            if not field.isidentifier():
+                raise ValueError(f"Unsupported template field: {field!r}")
+            if spec or conversion:
+                raise ValueError(
+                    f"Unsupported conversion or format spec on field {field!r}"
+                )
+            parts.append(f"str({field})")
+            if field not in fields:
+                fields.append(field)
+
+    params = ["*", *fields, "**_"] if fields else ["**_"]
+    source = (
+        f"def render({', '.join(params)}):\n"
+        f"    return ''.join(({''.join(part + ', ' for part in parts)}))\n"
+    )
+    namespace: dict = {f"_L{i}": literal for i, literal in enumerate(literals)}
+    exec(compile(source, "<prompt template>", "exec"), namespace)
+    return namespace["render"]
 
 
 class BaseAgent:
@@ -8,39 +66,249 @@ class BaseAgent:
         llm,
         tools: list,
         system_prompt: str = None,
+        human_prompt: str = None,
+        response_format: Type[BaseModel] = None,
         agent_name: str = None,
         parser: Callable = None,
         debug: bool = False,
     ):
         from langgraph.prebuilt import create_react_agent
 
+        # The final answer is JSON in text, validated against response_format.
+        # Passing the schema to create_react_agent instead would add a
+        # structured-output LLM call, resending the whole run, to every run.
+        if response_format is not None:
+            system_prompt = (
+                f"{system_prompt or ''}\n\n{get_format_instructions(response_format)}"
+            )
         self.agent = create_react_agent(
             model=llm,
             tools=tools,
             prompt=system_prompt,
+            pre_model_hook=(
+                trim_tool_output
+                if config.TOOL_OUTPUT_MAX_LINES > 0 or config.TOOL_OUTPUT_RECENT > 0
+                else None
+            ),
             name=agent_name,
             debug=debug,
         )
         self.parser = parser
+        self.response_format = response_format
+        self._render_prompt = compile_template(human_prompt or "")
+
+    def _render(self, **fields: Any) -> str:
+        """Fill the precompiled human prompt template with fields"""
+        return self._render_prompt(**fields)
+
+    @staticmethod
+    def _dumps_alert(alert_data: dict) -> str:
+        """Serialize an alert for a prompt, clipped to ALERT_PROMPT_MAX_CHARS"""
+        return clip_middle(dumps_shared(alert_data), config.ALERT_PROMPT_MAX_CHARS)
 
     def run(self, human_prompt: str) -> Any:
         result = self.agent.invoke(
             {"messages": [{"role": "user", "content": human_prompt}]}
         )
+        return self._parse_result(result)
+
+    async def arun(self, human_prompt: str) -> Any:
+        result = await self.agent.ainvoke(
+            {"messages": [{"role": "user", "content": human_prompt}]}
+        )
+        return self._parse_result(result)
+
+    async def astream(self, human_prompt: str) -> AsyncIterator[Any]:
+        """Stream the agent run, yielding the answer as it is being generated.
+
+        Partially parsed JSON is yielded while the final answer streams in, so
+        callers can act on it before generation completes. The answer is only
+        re-parsed when a chunk opens or closes a JSON object or array, as
+        re-parsing the whole buffer for every token is quadratic. The last
+        item is always the fully parsed result of the run.
+        """
+        content = ""
+        message_id = None
+        final_state = None
+        async for mode, data in self.agent.astream(
+            {"messages": [{"role": "user", "content": human_prompt}]},
+            stream_mode=["messages", "values"],
+        ):
+            if mode == "values":
+                final_state = data
+                continue
+
+            chunk, metadata = data
+            if (
+                not isinstance(chunk, AIMessageChunk)
+                or chunk.tool_call_chunks
+                or metadata.get("langgraph_node") != "agent"
+            ):
+                continue
+            if chunk.id != message_id:
+                # A new model turn started; earlier text was not the answer
+                message_id, content = chunk.id, ""
+            text = chunk.text()
+            content += text
+            if not _JSON_STRUCTURE_CHARS.intersection(text):
+                continue
+            try:
+                partial = parse_json_markdown(content)
+            except ValueError:
+                continue
+            if partial:
+                yield partial
+
+        yield self._parse_result(final_state)
+
+    async def abatch(self, human_prompts: List[str]) -> List[Any]:
+        """Run several prompts concurrently, bounded by LLM_MAX_CONCURRENCY.
+
+        Failures are returned in place as exceptions so one bad incident does
+        not fail the whole batch.
+        """
+        results = await self.agent.abatch(
+            [
+                {"messages": [{"role": "user", "content": human_prompt}]}
+                for human_prompt in human_prompts
+            ],
+            config={"max_concurrency": config.LLM_MAX_CONCURRENCY},
+            return_exceptions=True,
+        )
+        return [
+            result if isinstance(result, Exception) else self._parse_result(result)
+            for result in results
+        ]
+
+    async def _abatch_packed(self, *args: Any) -> List[Any]:
+        """Collect the results of _astream_packed in prompt order"""
+        results: List[Any] = []
+        async for i, result in self._astream_packed(*args):
+            results.extend([None] * (i + 1 - len(results)))
+            results[i] = result
+        return results
+
+    async def _astream_packed(
+        self,
+        packed_agent: "BaseAgent",
+        prompts: List[str],
+        payloads: List[str],
+        format_pack: Callable[[List[int]], str],
+        pack_size: int,
+        max_chars: int,
+        results_key: str,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Run prompts in packs of up to pack_size incidents per LLM call.
+
+        Yields (index, result) pairs as results become available. packed_agent
+        answers with a results_key list whose entries carry the "incident_id"
+        shown in the pack. Without a response_format to validate the whole
+        answer against, it is streamed and each entry is yielded once the model
+        has moved on to the next.
+        Each entry is validated against this agent's response_format, as a
+        single-incident answer is. Incidents whose payloads would make a pack
+        larger than max_chars, and any a packed answer fails, skips or answers
+        invalidly, run on their own prompt.
+        """
+        packs, singles = [], []
+        for start in range(0, len(prompts), max(pack_size, 1)):
+            pack = list(range(start, min(start + pack_size, len(prompts))))
+            total = sum(len(payloads[i]) for i in pack)
+            if len(pack) > 1 and total <= max_chars:
+                packs.append(pack)
+            else:
+                singles.extend(pack)
+
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def emit(pack: List[int], entries: Any, sent: set):
+            for entry in entries if isinstance(entries, list) else ():
+                if not isinstance(entry, dict):
+                    continue
+                incident_id = str(entry.get("incident_id"))
+                i = next((i for i in pack if str(i) == incident_id), None)
+                if i is None or i in sent:
+                    continue
+                sent.add(i)
+                entry.pop("incident_id")
+                if self.response_format is not None:
+                    try:
+                        entry = self.response_format.model_validate(entry).model_dump()
+                    except ValidationError as e:
+                        # Left out of the results, so it is retried on its own
+                        logger.warning(f"Packed answer for incident {i} invalid: {e}")
+                        continue
+                queue.put_nowait((i, entry))
+
+        async def run_pack(pack: List[int]):
+            sent: set = set()
+            try:
+                if packed_agent.response_format is not None:
+                    answer = await packed_agent.arun(format_pack(pack))
+                else:
+                    answer = None
+                    async for item in packed_agent.astream(format_pack(pack)):
+                        # Every entry but the last of a partial answer is complete
+                        if isinstance(answer, dict):
+                            emit(pack, (answer.get(results_key) or [])[:-1], sent)
+                        answer = item
+                if isinstance(answer, dict):
+                    emit(pack, answer.get(results_key), sent)
+            except Exception as e:
+                logger.warning(f"Packed run of incidents {pack} failed: {e}")
+            finally:
+                queue.put_nowait(None)
+
+        async def run_singles():
+            try:
+                results = await BaseAgent.abatch(self, [prompts[i] for i in singles])
+                for i, result in zip(singles, results):
+                    queue.put_nowait((i, result))
+            finally:
+                queue.put_nowait(None)
+
+        tasks = [asyncio.ensure_future(run_pack(pack)) for pack in packs]
+        tasks.append(asyncio.ensure_future(run_singles()))
+        done = set()
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                    continue
+                done.add(item[0])
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Incidents a packed answer failed or skipped are run on their own
+        missing = [i for i in range(len(prompts)) if i not in done]
+        if missing:
+            retried = await BaseAgent.abatch(self, [prompts[i] for i in missing])
+            for i, result in zip(missing, retried):
+                yield i, result
+
+    def _parse_result(self, result: dict) -> Any:
         try:
             # if self.parser:
             #     return self.parser.parse(last_message)
-            content = result["messages"][-1].content
-
-            # Remove code block markers if present
-            if content.startswith("```json"):
-                content = content[len("```json") :].strip()
-            if content.endswith("```"):
-                content = content[:-3].strip()
-            parsed_result = json.loads(content)
-            return parsed_result
+            parsed = parse_llm_json(result["messages"][-1].text())
+            if self.response_format is not None:
+                return self.response_format.model_validate(parsed).model_dump()
+            return parsed
         except Exception as e:
             return {
                 "error": f"Error parsing agent result: {str(e)}",
-                "raw_result": str(result),
+                "raw_result": self._raw_tail(result),
             }
+
+    @staticmethod
+    def _raw_tail(result: dict) -> str:
+        """Tail of the final answer, without stringifying the whole run state"""
+        try:
+            raw = result["messages"][-1].text()
+        except Exception:
+            raw = str(result)
+        return raw[-RAW_RESULT_MAX_CHARS:]
@@ -0,0 +1,89 @@
+"""
+Micro-batching for agent invocations
+
+Requests that arrive within a short window are collected and handed to a
+batch handler together, so concurrent incidents share one dispatch instead of
+issuing one LLM round-trip each. A handler either returns the results in item
+order or is an async generator of (index, result) pairs, in which case each
+submitter is answered as soon as its own result is ready.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Union
+
+
+class MicroBatcher:
+    """Collect submitted items for a short window and process them as one batch"""
+
+    def __init__(
+        self,
+        handler: Callable[
+            [List[Any]], Union[Awaitable[List[Any]], AsyncIterator[tuple]]
+        ],
+        max_size: int = 16,
+        window_ms: int = 50,
+    ):
+        self.handler = handler
+        self.max_size = max_size
+        self.window = window_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: Any) -> Any:
+        """Submit an item and wait for its result from the next batch"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Bind the queue and worker to the loop we are actually running on
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._collect())
+
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect(self):
+        """Drain the queue into batches of up to max_size items or window seconds"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without blocking collection of the next batch
+            loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch: List[tuple]):
+        """Run the handler and resolve each submitter's future"""
+        futures = [future for _, future in batch]
+        try:
+            results = self.handler([item for item, _ in batch])
+            if hasattr(results, "__aiter__"):
+                async for i, result in results:
+                    self._resolve(futures[i], result)
+                unanswered = RuntimeError("Batch handler returned no result")
+                results = [unanswered] * len(batch)
+            else:
+                results = await results
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for future, result in zip(futures, results):
+            self._resolve(future, result)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any):
+        """Complete a submitter's future unless it already has an outcome"""
+        if future.done():
+            return
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
@@ -0,0 +1,100 @@
+"""
+Result caching for agent runs
+
+Alerts that repeat for the same target (flapping or re-sent by Alertmanager)
+produce the same prompt and the same analysis, so results are kept for a short
+time keyed by an alert fingerprint and reused instead of re-running the agent.
+Plans are cached the same way, keyed by the alert, the resource it targets and
+its diagnosed root cause.
+Concurrent requests for the same key share a single in-flight run.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from utils.json_utils import dumps
+
+# Labels naming the resource an alert is about; plans run commands against it
+_PLAN_TARGET_LABELS = ("node", "namespace", "deployment", "service", "pod", "container")
+
+
+def alert_fingerprint(alert_data: Dict[str, Any]) -> str:
+    """Fingerprint an alert by what it says, ignoring when it was raised"""
+    labels = alert_data.get("labels") or {}
+    # Timestamps and the generator URL differ between otherwise identical alerts
+    evidence = {
+        "status": alert_data.get("status"),
+        "labels": labels,
+        "annotations": alert_data.get("annotations") or {},
+    }
+    # Sorted keys so the same alert hashes the same whatever the field order
+    evidence_hash = hashlib.blake2b(
+        dumps(evidence, sort_keys=True).encode()
+    ).hexdigest()
+    key = "|".join(
+        str(labels.get(field) or "") for field in ("alertname", "node", "severity")
+    )
+    return hashlib.blake2b(f"{key}|{evidence_hash}".encode()).hexdigest()
+
+
+def plan_fingerprint(alert_data: Dict[str, Any], analysis_result: Any) -> str:
+    """Fingerprint the problem a plan addresses: alert, target and root cause"""
+    labels = alert_data.get("labels") or {}
+    analysis = analysis_result if isinstance(analysis_result, dict) else {}
+    # Case and whitespace differences in the model's wording are not new causes
+    root_cause = " ".join(str(analysis.get("root_cause", "")).lower().split())
+    components = sorted(map(str, analysis.get("affected_components") or ()))
+    # A plan's commands name its target, so another node or namespace is
+    # another plan even when the diagnosis reads the same
+    target = [str(labels.get(label) or "") for label in _PLAN_TARGET_LABELS]
+    key = "|".join(
+        [str(labels.get("alertname") or ""), *target, root_cause, ",".join(components)]
+    )
+    return hashlib.blake2b(key.encode()).hexdigest()
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ttl seconds after they are stored"""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any):
+        """Store a value, evicting the oldest entry when full"""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class InflightCoalescer:
+    """Share one in-flight call among concurrent callers with the same key"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the call already running for key, or start it with factory"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # One caller being cancelled must not cancel the shared call
+        return await asyncio.shield(future)
@@ -3,21 +3,15 @@ Tools for Executor Agent - Execution and simulation tools
 """
 
 from langchain.tools import tool
-import json
-import uuid
 from datetime import datetime
+from types import MappingProxyType
 
+from utils.ids import short_id
+from utils.json_utils import dumps, loads
 
-@tool
-def simulate_kubectl_command(command: str) -> str:
-    """
-    Simulate kubectl command execution (simulation mode)
-    command: The kubectl command to simulate
-    """
-    timestamp = datetime.now().isoformat()
-
-    # Simulation results based on command type
-    simulation_results = {
+# Simulation results based on command type
+_SIMULATION_RESULTS = MappingProxyType(
+    {
         "get pods": {
             "status": "success",
             "output": "NAME                    READY   STATUS    RESTARTS   AGE\nnginx-deployment-xxx   1/1     Running   0          5m",
@@ -74,10 +68,84 @@ def simulate_kubectl_command(command: str) -> str:
             "execution_time": "1.8s",
         },
     }
+)
+
+
+# Simulation of verification checks
+_VERIFICATION_RESULTS = MappingProxyType(
+    {
+        "pod status": {
+            "status": "healthy",
+            "details": "All pods are running and ready",
+            "check_time": "2.1s",
+        },
+        "node status": {
+            "status": "healthy",
+            "details": "Node is ready and schedulable",
+            "check_time": "1.5s",
+        },
+        "deployment status": {
+            "status": "healthy",
+            "details": "Deployment is available with desired replicas",
+            "check_time": "3.2s",
+        },
+        "service status": {
+            "status": "healthy",
+            "details": "Service endpoints are ready",
+            "check_time": "1.8s",
+        },
+        "resource utilization": {
+            "status": "normal",
+            "details": "CPU and memory usage within normal ranges",
+            "check_time": "4.5s",
+        },
+    }
+)
+
+
+# Simulation of rollback operations
+_ROLLBACK_RESULTS = MappingProxyType(
+    {
+        "scale": {
+            "status": "success",
+            "details": "Deployment scaled back to original replica count",
+            "rollback_time": "15.2s",
+        },
+        "restart": {
+            "status": "success",
+            "details": "Rollback completed, service restored",
+            "rollback_time": "30.5s",
+        },
+        "patch": {
+            "status": "success",
+            "details": "Original configuration restored",
+            "rollback_time": "8.9s",
+        },
+        "uncordon": {
+            "status": "success",
+            "details": "Node uncordoned, scheduling enabled",
+            "rollback_time": "2.1s",
+        },
+        "apply": {
+            "status": "success",
+            "details": "Original resource configuration restored from backup",
+            "rollback_time": "12.3s",
+        },
+    }
+)
+
+
+@tool
+def simulate_kubectl_command(command: str) -> str:
+    """
+    Simulate kubectl command execution (simulation mode)
+    command: The kubectl command to simulate
+    """
+    timestamp = datetime.now().isoformat()
 
     # Find matching command pattern
     result = None
-    for pattern, sim_result in simulation_results.items():
+    for pattern, sim_result in _SIMULATION_RESULTS.items():
         if pattern in command.lower():
             result = sim_result
             break
@@ -93,10 +161,10 @@ def simulate_kubectl_command(command: str) -> str:
         "command": command,
         "timestamp": timestamp,
         "simulation_result": result,
-        "execution_id": str(uuid.uuid4())[:8],
+        "execution_id": short_id(),
     }
 
-    return json.dumps(execution_log, indent=2)
+    return dumps(execution_log)
 
 
 @tool
@@ -108,38 +176,9 @@ def verify_system_state(check_description: str, expected_state: str = "") -> str
     """
     timestamp = datetime.now().isoformat()
 
-    # Simulation of verification checks
-    verification_results = {
-        "pod status": {
-            "status": "healthy",
-            "details": "All pods are running and ready",
-            "check_time": "2.1s",
-        },
-        "node status": {
-            "status": "healthy",
-            "details": "Node is ready and schedulable",
-            "check_time": "1.5s",
-        },
-        "deployment status": {
-            "status": "healthy",
-            "details": "Deployment is available with desired replicas",
-            "check_time": "3.2s",
-        },
-        "service status": {
-            "status": "healthy",
-            "details": "Service endpoints are ready",
-            "check_time": "1.8s",
-        },
-        "resource utilization": {
-            "status": "normal",
-            "details": "CPU and memory usage within normal ranges",
-            "check_time": "4.5s",
-        },
-    }
-
     # Find matching verification
     result = None
-    for check_type, verify_result in verification_results.items():
+    for check_type, verify_result in _VERIFICATION_RESULTS.items():
         if check_type in check_description.lower():
             result = verify_result
             break
@@ -156,10 +195,10 @@ def verify_system_state(check_description: str, expected_state: str = "") -> str
         "expected_state": expected_state,
         "timestamp": timestamp,
         "verification_result": result,
-        "verification_id": str(uuid.uuid4())[:8],
+        "verification_id": short_id(),
     }
 
-    return json.dumps(verification_log, indent=2)
+    return dumps(verification_log)
 
 
 @tool
@@ -171,38 +210,9 @@ def rollback_action(rollback_command: str, reason: str) -> str:
     """
     timestamp = datetime.now().isoformat()
 
-    # Simulation of rollback operations
-    rollback_results = {
-        "scale": {
-            "status": "success",
-            "details": "Deployment scaled back to original replica count",
-            "rollback_time": "15.2s",
-        },
-        "restart": {
-            "status": "success",
-            "details": "Rollback completed, service restored",
-            "rollback_time": "30.5s",
-        },
-        "patch": {
-            "status": "success",
-            "details": "Original configuration restored",
-            "rollback_time": "8.9s",
-        },
-        "uncordon": {
-            "status": "success",
-            "details": "Node uncordoned, scheduling enabled",
-            "rollback_time": "2.1s",
-        },
-        "apply": {
-            "status": "success",
-            "details": "Original resource configuration restored from backup",
-            "rollback_time": "12.3s",
-        },
-    }
-
     # Find matching rollback
     result = None
-    for rollback_type, rollback_result in rollback_results.items():
+    for rollback_type, rollback_result in _ROLLBACK_RESULTS.items():
         if rollback_type in rollback_command.lower():
             result = rollback_result
             break
@@ -219,10 +229,10 @@ def rollback_action(rollback_command: str, reason: str) -> str:
         "reason": reason,
         "timestamp": timestamp,
         "rollback_result": result,
-        "rollback_id": str(uuid.uuid4())[:8],
+        "rollback_id": short_id(),
     }
 
-    return json.dumps(rollback_log, indent=2)
+    return dumps(rollback_log)
 
 
 @tool
@@ -250,10 +260,10 @@ def log_execution_step(
         "status": status,
         "details": details,
         "timestamp": timestamp,
-        "log_id": str(uuid.uuid4())[:8],
+        "log_id": short_id(),
     }
 
-    return json.dumps(log_entry, indent=2)
+    return dumps(log_entry)
 
 
 @tool
@@ -267,7 +277,7 @@ def validate_prerequisites(prerequisites: str) -> str:
     # Parse prerequisites if it's a JSON string, otherwise split by comma
     try:
         prereq_list = (
-            json.loads(prerequisites)
+            loads(prerequisites)
             if prerequisites.startswith("[")
             else prerequisites.split(",")
         )
@@ -319,10 +329,10 @@ def validate_prerequisites(prerequisites: str) -> str:
         "all_valid": all_valid,
         "timestamp": timestamp,
         "validation_results": validation_results,
-        "validation_id": str(uuid.uuid4())[:8],
+        "validation_id": short_id(),
     }
 
-    return json.dumps(validation_log, indent=2)
+    return dumps(validation_log)
 
 
 def get_executor_tools():
@@ -0,0 +1,64 @@
+"""
+Message history trimming
+
+kubectl and search tools can return thousands of lines (full pod logs, long
+describe output). Only the tail of each tool result, where the most recent
+events are, is sent back to the model; the graph state keeps the full output.
+Results older than the most recent few have already been reasoned over and are
+cut shorter still, so long investigations do not resend every earlier output.
+"""
+
+import logging
+
+from config import config
+from langchain_core.messages import ToolMessage
+
+logger = logging.getLogger(__name__)
+
+# Lines kept from tool results older than the TOOL_OUTPUT_RECENT most recent
+OLDER_TOOL_OUTPUT_LINES = 20
+
+
+def tail_lines(content: str, max_lines: int) -> str:
+    """Keep the last max_lines lines of content, noting how many were dropped"""
+    lines = content.splitlines()
+    if len(lines) <= max_lines:
+        return content
+    dropped = len(lines) - max_lines
+    return f"[... {dropped} earlier lines omitted ...]\n" + "\n".join(
+        lines[-max_lines:]
+    )
+
+
+def trim_tool_output(state: dict) -> dict:
+    """Pre-model hook that sends only the tail of long tool results to the LLM"""
+    max_lines = config.TOOL_OUTPUT_MAX_LINES
+    recent = config.TOOL_OUTPUT_RECENT
+    older_lines = OLDER_TOOL_OUTPUT_LINES
+    if max_lines > 0:
+        older_lines = min(older_lines, max_lines)
+    tool_results = [
+        i
+        for i, message in enumerate(state["messages"])
+        if isinstance(message, ToolMessage)
+    ]
+    older = set(tool_results[:-recent]) if recent > 0 else set()
+
+    messages = []
+    saved = 0
+    for i, message in enumerate(state["messages"]):
+        limit = older_lines if i in older else max_lines
+        if (
+            limit > 0
+            and isinstance(message, ToolMessage)
+            and isinstance(message.content, str)
+        ):
+            content = tail_lines(message.content, limit)
+            if content is not message.content:
+                saved += len(message.content) - len(content)
+                message = message.model_copy(update={"content": content})
+        messages.append(message)
+
+    if saved:
+        logger.debug(f"Trimmed {saved} characters of tool output from the prompt")
+    return {"llm_input_messages": messages}
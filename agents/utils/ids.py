@@ -0,0 +1,38 @@
+"""
+Identifier generation
+
+uuid.uuid4() reads the OS random source once for every id. Ids here are cut
+from a per-thread buffer of random bytes that is refilled with a single
+os.urandom call, so a burst of incidents and tool calls costs one read per
+few hundred ids.
+"""
+
+import os
+import threading
+import uuid
+
+# Random bytes fetched per refill; enough for 256 UUIDs
+_REFILL_BYTES = 16 * 256
+
+_local = threading.local()
+
+
+def _random_bytes(n: int) -> bytes:
+    """Take n random bytes from this thread's buffer, refilling it when empty"""
+    buffer = getattr(_local, "buffer", b"")
+    offset = getattr(_local, "offset", 0)
+    if offset + n > len(buffer):
+        buffer, offset = os.urandom(_REFILL_BYTES), 0
+        _local.buffer = buffer
+    _local.offset = offset + n
+    return buffer[offset : offset + n]
+
+
+def new_uuid() -> str:
+    """Random UUID string, equivalent to str(uuid.uuid4())"""
+    return str(uuid.UUID(bytes=_random_bytes(16), version=4))
+
+
+def short_id() -> str:
+    """Eight random hex characters, equivalent to str(uuid.uuid4())[:8]"""
+    return _random_bytes(4).hex()
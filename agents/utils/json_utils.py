@@ -0,0 +1,69 @@
+"""
+JSON helpers backed by orjson
+
+orjson is several times faster than the stdlib encoder and natively handles the
+datetime and Enum values found in validated alert payloads.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Serialized forms of recently shared objects, by object identity. Each entry
+# keeps its object alive so the id cannot be reused while it is cached.
+_SHARED: "OrderedDict[int, tuple]" = OrderedDict()
+_SHARED_MAX = 256
+# Slack messages are built in worker threads while agents run on the loop
+_SHARED_LOCK = threading.Lock()
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize obj to a JSON string, compact unless indent is requested"""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, option=option).decode()
+
+
+def dumps_shared(obj: Any) -> str:
+    """Compact dumps() memoized by object identity.
+
+    For payloads handed unchanged from agent to agent, such as the alert and
+    its analysis; obj must not be mutated after it is first serialized. Safe
+    to call from any thread.
+    """
+    with _SHARED_LOCK:
+        entry = _SHARED.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            _SHARED.move_to_end(id(obj))
+            return entry[1]
+    # Serialized outside the lock; a concurrent miss on the same object only
+    # serializes it twice
+    text = dumps(obj)
+    with _SHARED_LOCK:
+        _SHARED[id(obj)] = (obj, text)
+        if len(_SHARED) > _SHARED_MAX:
+            _SHARED.popitem(last=False)
+    return text
+
+
+def clip_middle(text: str, max_chars: int) -> str:
+    """Keep the head and tail of text within max_chars; 0 keeps all of it"""
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+    dropped = len(text) - max_chars
+    logger.warning(f"Clipped {dropped} characters from the middle of a prompt payload")
+    half = max_chars // 2
+    return f"{text[:half]}[... {dropped} characters omitted ...]{text[-half:]}"
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON string or bytes"""
+    return orjson.loads(data)
@@ -0,0 +1,36 @@
+"""
+Logging setup
+
+Records are put on an in-memory queue by the caller and written to stderr by
+a background listener thread, so request handlers never block on the write.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from config import config
+
+_listener = None
+
+
+def setup_logging():
+    """Route root logging through a queue drained by a background listener"""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if config.debug_mode else logging.INFO)
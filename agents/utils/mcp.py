@@ -0,0 +1,90 @@
+"""
+Persistent MCP sessions
+
+Tools returned by MultiServerMCPClient.get_tools() open a new session for
+every call, which for stdio servers means starting a fresh kubectl-ai process
+per tool invocation. This keeps one session open and binds the tools to it.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from langchain.tools import BaseTool, tool
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+from utils.history import tail_lines
+
+logger = logging.getLogger(__name__)
+
+# Baseline commands an investigation opens with, run together by initial_snapshot
+INITIAL_SNAPSHOT_COMMANDS = (
+    "kubectl cluster-info",
+    "kubectl get nodes -o wide",
+    "kubectl get pods --all-namespaces --field-selector=status.phase!=Running",
+    "kubectl get events --all-namespaces --sort-by=.lastTimestamp",
+)
+
+# Lines kept from each command's output, so one long section cannot push the
+# others out of the trimmed tool result
+SNAPSHOT_SECTION_MAX_LINES = 50
+
+
+class PersistentMCPSession:
+    """Hold one MCP server session open for the life of the process"""
+
+    def __init__(self, client: MultiServerMCPClient, server_name: str):
+        self.client = client
+        self.server_name = server_name
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    async def start(self) -> list:
+        """Open the session in a background task and return its tools"""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        self._stop = asyncio.Event()
+        self._task = loop.create_task(self._hold(ready))
+        return await ready
+
+    async def stop(self):
+        """Close the session and wait for the server to exit"""
+        if self._task is not None:
+            self._stop.set()
+            await self._task
+            self._task = None
+
+    async def _hold(self, ready: asyncio.Future):
+        """Keep the session open until stop(); it must exit in the task it entered"""
+        try:
+            async with self.client.session(self.server_name) as session:
+                ready.set_result(await load_mcp_tools(session))
+                await self._stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.error(f"MCP session {self.server_name} closed: {e}")
+
+
+def initial_snapshot_tool(kubectl: BaseTool) -> BaseTool:
+    """Build a tool that runs the baseline kubectl commands concurrently"""
+
+    @tool
+    async def initial_snapshot() -> str:
+        """Get the cluster baseline in one call: cluster info, nodes, pods that
+        are not running and recent events. Call this first when starting an
+        investigation."""
+        outputs = await asyncio.gather(
+            *(
+                kubectl.ainvoke({"command": command, "modifies_resource": "no"})
+                for command in INITIAL_SNAPSHOT_COMMANDS
+            ),
+            return_exceptions=True,
+        )
+        return "\n\n".join(
+            f"$ {command}\n{tail_lines(str(output), SNAPSHOT_SECTION_MAX_LINES)}"
+            for command, output in zip(INITIAL_SNAPSHOT_COMMANDS, outputs)
+        )
+
+    return initial_snapshot
@@ -2,9 +2,18 @@
 Output parsers for agents
 """
 
+import functools
+import re
+
 from langchain.output_parsers import PydanticOutputParser
+from langchain_core.utils.json import parse_partial_json
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Type
+
+from utils.json_utils import loads
+
+_FENCE_RE = re.compile(r"```(\w*)\s*(.*?)\s*(?:```|$)", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
 
 
 class AnalysisResult(BaseModel):
@@ -20,30 +29,85 @@ class AnalysisResult(BaseModel):
     investigation_summary: str = Field(
         description="Summary of the investigation process"
     )
+    confidence_level: str = Field(
+        default="Medium", description="Confidence in the diagnosis: High, Medium, Low"
+    )
+    recommendations: List[str] = Field(
+        default_factory=list, description="Immediate action steps for remediation"
+    )
+
+
+class IncidentAnalysis(AnalysisResult):
+    """Analysis of one incident within a batch"""
+
+    incident_id: str = Field(description="Id of the incident this analysis is for")
+
+
+class AnalysisBatch(BaseModel):
+    """Analyses of several incidents from one Analyst run"""
+
+    analyses: List[IncidentAnalysis] = Field(description="One analysis per incident")
 
 
 class PlanStep(BaseModel):
     """A step in the remediation plan"""
 
     step_number: int = Field(description="Step sequence number")
-    action: str = Field(description="Action to be performed")
-    command: str = Field(description="kubectl command or script to run")
-    expected_result: str = Field(description="Expected result")
+    action: str = Field(description="Detailed action description")
+    command: str = Field(description="Exact kubectl command with parameters")
+    dry_run_command: Optional[str] = Field(
+        default=None, description="Safe validation command to test first"
+    )
+    expected_result: str = Field(description="Specific outcomes to verify")
     rollback_command: Optional[str] = Field(
-        description="Rollback command if error occurs"
+        description="Complete rollback procedure if the step fails"
+    )
+    verification_method: Optional[str] = Field(
+        default=None, description="How to confirm success before proceeding"
+    )
+    estimated_duration: Optional[str] = Field(
+        default=None, description="Time allocation for this step"
+    )
+    risk_level: Optional[str] = Field(
+        default=None, description="Step risk: low, medium, high, critical"
+    )
+    escalation_trigger: Optional[str] = Field(
+        default=None, description="When to halt and escalate"
+    )
+    depends_on: List[int] = Field(
+        default_factory=list,
+        description="Step numbers that must complete before this step; empty if independent",
     )
 
 
 class RemediationPlan(BaseModel):
     """Remediation plan from Planner agent"""
 
-    plan_id: str = Field(description="Plan ID")
-    plan_name: str = Field(description="Plan name")
-    description: str = Field(description="Plan description")
-    risk_level: str = Field(description="Risk level: low, medium, high")
-    estimated_time: str = Field(description="Estimated time")
-    steps: List[PlanStep] = Field(description="Execution steps")
+    plan_id: str = Field(description="Unique plan ID")
+    plan_name: str = Field(description="Descriptive plan title")
+    description: str = Field(description="Comprehensive overview of the plan")
+    risk_level: str = Field(description="Risk level: low, medium, high, critical")
+    estimated_execution_time: str = Field(description="Estimated time for execution")
+    business_impact: str = Field(
+        default="", description="Expected service disruption during execution"
+    )
     prerequisites: List[str] = Field(description="Prerequisites")
+    success_criteria: List[str] = Field(
+        default_factory=list, description="Measurable outcomes for success"
+    )
+    steps: List[PlanStep] = Field(description="Execution steps")
+    post_execution_validation_procedures: List[str] = Field(
+        default_factory=list, description="Final system health checks"
+    )
+    monitoring_plan: List[str] = Field(
+        default_factory=list, description="What to monitor post-remediation"
+    )
+    alert_adjustments: List[str] = Field(
+        default_factory=list, description="Alert threshold modifications needed"
+    )
+    documentation_updates: List[str] = Field(
+        default_factory=list, description="Required procedure or runbook updates"
+    )
 
 
 class ExecutionResult(BaseModel):
@@ -63,16 +127,92 @@ plan_parser = PydanticOutputParser(pydantic_object=RemediationPlan)
 execution_parser = PydanticOutputParser(pydantic_object=ExecutionResult)
 
 
+# Format instructions embed the model's JSON schema, which is generated anew on
+# every call; the schemas are fixed, so each is built once.
+@functools.lru_cache(maxsize=None)
 def get_analysis_format_instructions():
     """Return format instructions for Analyst"""
     return analysis_parser.get_format_instructions()
 
 
+@functools.lru_cache(maxsize=None)
 def get_plan_format_instructions():
     """Return format instructions for Planner"""
     return plan_parser.get_format_instructions()
 
 
+@functools.lru_cache(maxsize=None)
 def get_execution_format_instructions():
     """Return format instructions for Executor"""
     return execution_parser.get_format_instructions()
+
+
+@functools.lru_cache(maxsize=None)
+def get_format_instructions(schema: Type[BaseModel]) -> str:
+    """Return format instructions for any output schema"""
+    return PydanticOutputParser(pydantic_object=schema).get_format_instructions()
+
+
+def _fenced_blocks(text: str) -> List[Tuple[str, str]]:
+    """(language, contents) of the ``` blocks in text, ```json blocks first"""
+    blocks = [(m.group(1).lower(), m.group(2)) for m in _FENCE_RE.finditer(text)]
+    # sort() is stable: json blocks, then untagged ones, then other languages
+    blocks.sort(key=lambda block: (block[0] != "json", block[0] != ""))
+    return blocks
+
+
+def _json_start(text: str) -> int:
+    """Index of the first { or [ in text, or -1"""
+    return min((i for i in (text.find("{"), text.find("[")) if i != -1), default=-1)
+
+
+def parse_llm_json(text: str) -> Any:
+    """
+    Extract the JSON answer from an LLM response.
+
+    Tries, in order: the text as is, each ``` block (```json blocks first),
+    the outermost object or array within surrounding prose, the same with
+    trailing commas removed, and finally a lenient parse that closes a
+    truncated answer.
+
+    Raises:
+        ValueError: If no JSON can be recovered.
+    """
+    text = text.strip()
+    try:
+        return loads(text)
+    except ValueError:
+        pass
+
+    blocks = _fenced_blocks(text)
+    for _, block in blocks:
+        try:
+            return loads(block)
+        except ValueError:
+            pass
+
+    # A json or untagged fence is sliced first; the whole text covers a fence
+    # cut short by ``` inside a string value, or JSON that was not fenced
+    sources = [
+        block
+        for language, block in blocks[:1]
+        if language in ("json", "") and _json_start(block) != -1
+    ] + [text]
+    start = _json_start(sources[0])
+    if start == -1:
+        raise ValueError("No JSON found in LLM response")
+    for source in sources:
+        begin = _json_start(source)
+        end = max(source.rfind("}"), source.rfind("]"))
+        candidate = source[begin : end + 1] if end > begin else source[begin:]
+        for attempt in (candidate, _TRAILING_COMMA_RE.sub(r"\1", candidate)):
+            try:
+                return loads(attempt)
+            except ValueError:
+                pass
+
+    # Last resort: the answer may have been cut off mid-object
+    result = parse_partial_json(sources[0][start:])
+    if result is None:
+        raise ValueError("Could not parse JSON from LLM response")
+    return result
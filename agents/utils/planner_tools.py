@@ -2,66 +2,137 @@
 Tools for Planner Agent - Planning and remediation tools
 """
 
+import re
+from types import MappingProxyType
+
 from langchain.tools import tool
-import json
 
+from utils.json_utils import dumps, loads
 
-@tool
-def get_kubectl_commands(resource_type: str) -> str:
-    """
-    Get list of common kubectl commands for resource type
-    resource_type: Type of Kubernetes resource (pod, deployment, service, node, namespace, configmap, secret)
-    """
-    commands = {
-        "pod": [
+# Common kubectl commands by resource type
+_KUBECTL_COMMANDS = MappingProxyType(
+    {
+        "pod": (
             "kubectl get pods",
             "kubectl describe pod <pod-name>",
             "kubectl logs <pod-name>",
             "kubectl delete pod <pod-name>",
             "kubectl exec -it <pod-name> -- /bin/bash",
             "kubectl restart pod <pod-name>",
-        ],
-        "deployment": [
+        ),
+        "deployment": (
             "kubectl get deployments",
             "kubectl describe deployment <deployment-name>",
             "kubectl scale deployment <deployment-name> --replicas=<number>",
             "kubectl rollout restart deployment <deployment-name>",
             "kubectl rollout undo deployment <deployment-name>",
             "kubectl rollout status deployment <deployment-name>",
-        ],
-        "service": [
+        ),
+        "service": (
             "kubectl get services",
             "kubectl describe service <service-name>",
             "kubectl patch service <service-name> -p '<patch>'",
             "kubectl edit service <service-name>",
-        ],
-        "node": [
+        ),
+        "node": (
             "kubectl get nodes",
             "kubectl describe node <node-name>",
             "kubectl cordon <node-name>",
             "kubectl drain <node-name>",
             "kubectl uncordon <node-name>",
             "kubectl top node <node-name>",
-        ],
-        "namespace": [
+        ),
+        "namespace": (
             "kubectl get namespaces",
             "kubectl describe namespace <namespace-name>",
             "kubectl delete namespace <namespace-name>",
-        ],
-        "configmap": [
+        ),
+        "configmap": (
             "kubectl get configmaps",
             "kubectl describe configmap <configmap-name>",
             "kubectl edit configmap <configmap-name>",
-        ],
-        "secret": [
+        ),
+        "secret": (
             "kubectl get secrets",
             "kubectl describe secret <secret-name>",
             "kubectl delete secret <secret-name>",
-        ],
+        ),
     }
-    return json.dumps(
-        commands.get(resource_type, ["Resource type not found"]), indent=2
-    )
+)
+
+# Substrings that classify an action by risk
+_HIGH_RISK_ACTIONS = (
+    "delete",
+    "drain",
+    "cordon",
+    "scale down",
+    "restart",
+    "undo",
+    "remove",
+)
+_MEDIUM_RISK_ACTIONS = ("scale up", "patch", "update", "edit", "restart deployment")
+_LOW_RISK_ACTIONS = ("get", "describe", "logs", "top", "status")
+_HIGH_RISK_PATTERN = re.compile("|".join(map(re.escape, _HIGH_RISK_ACTIONS)))
+_MEDIUM_RISK_PATTERN = re.compile("|".join(map(re.escape, _MEDIUM_RISK_ACTIONS)))
+_LOW_RISK_PATTERN = re.compile("|".join(map(re.escape, _LOW_RISK_ACTIONS)))
+
+# Rollback command by resource type and action
+_ROLLBACK_MAPPING = MappingProxyType(
+    {
+        "pod": MappingProxyType(
+            {
+                "delete": "kubectl apply -f <backup-yaml>",
+                "restart": "# Pod sẽ tự restart nếu có deployment",
+            }
+        ),
+        "deployment": MappingProxyType(
+            {
+                "scale": "kubectl scale deployment <deployment-name> --replicas=<original-replicas>",
+                "restart": "# Deployment sẽ rollback tự động nếu fail",
+                "update": "kubectl rollout undo deployment <deployment-name>",
+                "delete": "kubectl apply -f <backup-yaml>",
+            }
+        ),
+        "service": MappingProxyType(
+            {
+                "patch": "kubectl patch service <service-name> -p '<original-patch>'",
+                "edit": "kubectl apply -f <backup-yaml>",
+                "delete": "kubectl apply -f <backup-yaml>",
+            }
+        ),
+        "node": MappingProxyType(
+            {
+                "cordon": "kubectl uncordon <node-name>",
+                "drain": "kubectl uncordon <node-name>",
+            }
+        ),
+    }
+)
+
+# Typical duration in seconds by kubectl verb
+_TIME_MAPPING = MappingProxyType(
+    {
+        "get": 1,
+        "describe": 2,
+        "logs": 3,
+        "delete": 5,
+        "restart": 30,
+        "scale": 15,
+        "patch": 10,
+        "drain": 300,  # 5 minutes
+        "cordon": 5,
+        "uncordon": 5,
+    }
+)
+
+
+@tool
+def get_kubectl_commands(resource_type: str) -> str:
+    """
+    Get list of common kubectl commands for resource type
+    resource_type: Type of Kubernetes resource (pod, deployment, service, node, namespace, configmap, secret)
+    """
+    return dumps(_KUBECTL_COMMANDS.get(resource_type, ["Resource type not found"]))
 
 
 @tool
@@ -73,7 +144,7 @@ def estimate_risk_level(action_list: str) -> str:
     # Parse action_list if it's a JSON string, otherwise split by comma
     try:
         actions = (
-            json.loads(action_list)
+            loads(action_list)
             if action_list.startswith("[")
             else action_list.split(",")
         )
@@ -82,30 +153,18 @@ def estimate_risk_level(action_list: str) -> str:
         actions = action_list.split(",")
         actions = [action.strip() for action in actions]
 
-    high_risk_actions = [
-        "delete",
-        "drain",
-        "cordon",
-        "scale down",
-        "restart",
-        "undo",
-        "remove",
-    ]
-    medium_risk_actions = ["scale up", "patch", "update", "edit", "restart deployment"]
-    low_risk_actions = ["get", "describe", "logs", "top", "status"]
-
     risk_score = 0
     risk_details = []
 
     for action in actions:
         action_lower = action.lower()
-        if any(hr in action_lower for hr in high_risk_actions):
+        if _HIGH_RISK_PATTERN.search(action_lower):
             risk_score += 3
             risk_details.append(f"HIGH RISK: {action}")
-        elif any(mr in action_lower for mr in medium_risk_actions):
+        elif _MEDIUM_RISK_PATTERN.search(action_lower):
             risk_score += 2
             risk_details.append(f"MEDIUM RISK: {action}")
-        elif any(lr in action_lower for lr in low_risk_actions):
+        elif _LOW_RISK_PATTERN.search(action_lower):
             risk_score += 1
             risk_details.append(f"LOW RISK: {action}")
         else:
@@ -119,9 +178,8 @@ def estimate_risk_level(action_list: str) -> str:
     else:
         level = "low"
 
-    return json.dumps(
-        {"risk_level": level, "risk_score": risk_score, "details": risk_details},
-        indent=2,
+    return dumps(
+        {"risk_level": level, "risk_score": risk_score, "details": risk_details}
     )
 
 
@@ -132,32 +190,11 @@ def get_rollback_commands(resource_type: str, action: str) -> str:
     resource_type: Type of Kubernetes resource (pod, deployment, service, node)
     action: Action that needs rollback (delete, restart, scale, patch, edit, cordon, drain)
     """
-    rollback_mapping = {
-        "pod": {
-            "delete": "kubectl apply -f <backup-yaml>",
-            "restart": "# Pod sẽ tự restart nếu có deployment",
-        },
-        "deployment": {
-            "scale": "kubectl scale deployment <deployment-name> --replicas=<original-replicas>",
-            "restart": "# Deployment sẽ rollback tự động nếu fail",
-            "update": "kubectl rollout undo deployment <deployment-name>",
-            "delete": "kubectl apply -f <backup-yaml>",
-        },
-        "service": {
-            "patch": "kubectl patch service <service-name> -p '<original-patch>'",
-            "edit": "kubectl apply -f <backup-yaml>",
-            "delete": "kubectl apply -f <backup-yaml>",
-        },
-        "node": {
-            "cordon": "kubectl uncordon <node-name>",
-            "drain": "kubectl uncordon <node-name>",
-        },
-    }
 
-    result = rollback_mapping.get(resource_type, {}).get(
+    result = _ROLLBACK_MAPPING.get(resource_type, {}).get(
         action, "Manual rollback required"
     )
-    return json.dumps({"rollback_command": result}, indent=2)
+    return dumps({"rollback_command": result})
 
 
 @tool
@@ -168,25 +205,12 @@ def estimate_execution_time(steps: str) -> str:
     """
     # Parse steps if it's a JSON string, otherwise split by comma
     try:
-        step_list = json.loads(steps) if steps.startswith("[") else steps.split(",")
+        step_list = loads(steps) if steps.startswith("[") else steps.split(",")
         step_list = [step.strip() for step in step_list]
     except Exception:
         step_list = steps.split(",")
         step_list = [step.strip() for step in step_list]
 
-    time_mapping = {
-        "get": 1,
-        "describe": 2,
-        "logs": 3,
-        "delete": 5,
-        "restart": 30,
-        "scale": 15,
-        "patch": 10,
-        "drain": 300,  # 5 minutes
-        "cordon": 5,
-        "uncordon": 5,
-    }
-
     total_time = 0
     step_details = []
 
@@ -194,7 +218,7 @@ def estimate_execution_time(steps: str) -> str:
         step_lower = step.lower()
         step_time = 10  # default time
 
-        for action, time_seconds in time_mapping.items():
+        for action, time_seconds in _TIME_MAPPING.items():
             if action in step_lower:
                 step_time = time_seconds
                 break
@@ -205,13 +229,12 @@ def estimate_execution_time(steps: str) -> str:
     # Thêm buffer time
     total_time = int(total_time * 1.2)  # 20% buffer
 
-    return json.dumps(
+    return dumps(
         {
             "total_time_seconds": total_time,
             "total_time_formatted": f"{total_time // 60}m {total_time % 60}s",
             "step_breakdown": step_details,
-        },
-        indent=2,
+        }
     )
 
 
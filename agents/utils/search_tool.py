@@ -2,89 +2,126 @@
 Search tools for Kubernetes analysis and troubleshooting
 """
 
-import json
+import functools
 import os
+import re
+from types import MappingProxyType
 
+from config import config
 from langchain.tools import tool
 from langchain_tavily import TavilySearch
+from utils.json_utils import dumps, loads
 
-# Set up API key
-if not os.environ.get("TAVILY_API_KEY"):
+# Set up API key; read through config so a key from .env is seen even though
+# config loads .env lazily
+if not config.TAVILY_API_KEY:
     os.environ["TAVILY_API_KEY"] = "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"
 
 
+@functools.lru_cache(maxsize=None)
+def _get_search_client(max_results: int) -> TavilySearch:
+    """Return a shared Tavily client for the given result count"""
+    return TavilySearch(max_results=max_results)
+
+
+# Keywords in an alert's description or summary that indicate each severity
+_SEVERITY_KEYWORDS = MappingProxyType(
+    {
+        "critical": ("down", "failed", "unavailable", "crash", "error", "critical"),
+        "warning": ("high", "latency", "slow", "degraded", "warning"),
+        "info": ("info", "notice", "low"),
+    }
+)
+_KEYWORD_LEVEL = MappingProxyType(
+    {
+        keyword: level
+        for level, keywords in _SEVERITY_KEYWORDS.items()
+        for keyword in keywords
+    }
+)
+# Single pass over the text; the lookahead also finds keywords inside others
+# ("low" in "slow"), matching plain substring checks
+_SEVERITY_PATTERN = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_KEYWORD_LEVEL, key=len, reverse=True)))
+    + "))"
+)
+
+
+# Web searches are awaited natively rather than run in a worker thread, like
+# the MCP kubectl tools they are used alongside
 @tool
-def search_k8s_docs(query: str) -> str:
+async def search_k8s_docs(query: str) -> str:
     """
     Search Kubernetes documentation and best practices
     query: Search query for Kubernetes documentation
     """
-    search_tool = TavilySearch(max_results=3)
+    search_tool = _get_search_client(3)
     k8s_query = f"Kubernetes {query} troubleshooting documentation official"
-    results = search_tool.invoke(k8s_query)
-    return json.dumps(results, indent=2)
+    results = await search_tool.ainvoke(k8s_query)
+    return dumps(results)
 
 
 @tool
-def search_alert_solutions(alert_name: str, description: str) -> str:
+async def search_alert_solutions(alert_name: str, description: str) -> str:
     """
     Search solutions for specific alerts
     alert_name: Name of the alert
     description: Description of the alert
     """
-    search_tool = TavilySearch(max_results=3)
+    search_tool = _get_search_client(3)
     query = f"{alert_name} {description} kubernetes solution fix remediation"
-    results = search_tool.invoke(query)
-    return json.dumps(results, indent=2)
+    results = await search_tool.ainvoke(query)
+    return dumps(results)
 
 
 @tool
-def kubectl_help(command: str) -> str:
+async def kubectl_help(command: str) -> str:
     """
     Search information about kubectl commands
     command: The kubectl command to search for
     """
-    search_tool = TavilySearch(max_results=2)
+    search_tool = _get_search_client(2)
     query = f"kubectl {command} kubernetes command documentation examples usage"
-    results = search_tool.invoke(query)
-    return json.dumps(results, indent=2)
+    results = await search_tool.ainvoke(query)
+    return dumps(results)
 
 
 @tool
-def search_error_patterns(error_message: str) -> str:
+async def search_error_patterns(error_message: str) -> str:
     """
     Search patterns and root causes of error messages
     error_message: The error message to analyze
     """
-    search_tool = TavilySearch(max_results=4)
+    search_tool = _get_search_client(4)
     query = f"kubernetes error '{error_message}' troubleshooting root cause"
-    results = search_tool.invoke(query)
-    return json.dumps(results, indent=2)
+    results = await search_tool.ainvoke(query)
+    return dumps(results)
 
 
 @tool
-def search_performance_metrics(metric_name: str, threshold: str) -> str:
+async def search_performance_metrics(metric_name: str, threshold: str) -> str:
     """
     Search information about metrics and thresholds
     metric_name: Name of the performance metric
     threshold: Threshold value for the metric
     """
-    search_tool = TavilySearch(max_results=3)
+    search_tool = _get_search_client(3)
     query = f"kubernetes {metric_name} {threshold} performance monitoring alerting"
-    results = search_tool.invoke(query)
-    return json.dumps(results, indent=2)
+    results = await search_tool.ainvoke(query)
+    return dumps(results)
 
 
 @tool
-def search_component_health(component: str) -> str:
+async def search_component_health(component: str) -> str:
     """
     Search information about component health checks
     component: Name of the Kubernetes component
     """
-    search_tool = TavilySearch(max_results=3)
+    search_tool = _get_search_client(3)
     query = f"kubernetes {component} health check monitoring troubleshooting"
-    results = search_tool.invoke(query)
-    return json.dumps(results, indent=2)
+    results = await search_tool.ainvoke(query)
+    return dumps(results)
 
 
 @tool
@@ -97,24 +134,18 @@ def analyze_alert_severity(alert_labels: str, annotations: str) -> str:
     # Parse JSON strings to dictionaries
     try:
         labels_dict = (
-            json.loads(alert_labels) if isinstance(alert_labels, str) else alert_labels
+            loads(alert_labels) if isinstance(alert_labels, str) else alert_labels
         )
     except Exception:
         labels_dict = {}
 
     try:
         annotations_dict = (
-            json.loads(annotations) if isinstance(annotations, str) else annotations
+            loads(annotations) if isinstance(annotations, str) else annotations
         )
     except Exception:
         annotations_dict = {}
 
-    severity_keywords = {
-        "critical": ["down", "failed", "unavailable", "crash", "error", "critical"],
-        "warning": ["high", "latency", "slow", "degraded", "warning"],
-        "info": ["info", "notice", "low"],
-    }
-
     # Get severity from labels
     severity = labels_dict.get("severity", "unknown").lower()
 
@@ -123,10 +154,9 @@ def analyze_alert_severity(alert_labels: str, annotations: str) -> str:
     summary = annotations_dict.get("summary", "").lower()
     text_to_analyze = f"{description} {summary}"
 
-    severity_scores = {}
-    for level, keywords in severity_keywords.items():
-        score = sum(1 for keyword in keywords if keyword in text_to_analyze)
-        severity_scores[level] = score
+    severity_scores = dict.fromkeys(_SEVERITY_KEYWORDS, 0)
+    for keyword in {m.group(1) for m in _SEVERITY_PATTERN.finditer(text_to_analyze)}:
+        severity_scores[_KEYWORD_LEVEL[keyword]] += 1
 
     # Determine severity based on analysis
     analyzed_severity = (
@@ -140,13 +170,13 @@ def analyze_alert_severity(alert_labels: str, annotations: str) -> str:
         "analyzed_severity": analyzed_severity,
         "severity_scores": severity_scores,
         "confidence": max(severity_scores.values())
-        / len(severity_keywords[analyzed_severity])
+        / len(_SEVERITY_KEYWORDS[analyzed_severity])
         if analyzed_severity != "unknown"
         else 0,
         "analysis_text": text_to_analyze[:200],  # First 200 chars
     }
 
-    return json.dumps(analysis_result, indent=2)
+    return dumps(analysis_result)
 
 
 def get_analysis_tools():
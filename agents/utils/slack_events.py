@@ -4,12 +4,12 @@ Slack Event Handler
 This module handles incoming Slack events and interactions for the kube-multi-agent system.
 """
 
-import json
 import logging
 from typing import Any, Callable, Dict
 
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.web import WebClient
+from utils.json_utils import loads
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,24 @@ class SlackEventHandler:
         self.web_client = web_client
         self.button_handlers: Dict[str, Callable] = {}
 
+        # Dispatch tables, keyed by the "type" field at each payload level
+        self._event_handlers: Dict[str, Callable] = {
+            "events_api": self._handle_events_api,
+            "interactive": self._handle_interactive,
+        }
+        self._events_api_handlers: Dict[str, Callable] = {
+            "url_verification": self._handle_url_verification,
+            "event_callback": self._handle_event_callback,
+        }
+        self._interactive_handlers: Dict[str, Callable] = {
+            "block_actions": self._handle_block_actions,
+            "view_submission": self._handle_view_submission,
+        }
+        self._callback_handlers: Dict[str, Callable] = {
+            "message": self._handle_message,
+            "app_mention": self._handle_app_mention,
+        }
+
     def register_button_handler(self, action_id: str, handler: Callable):
         """Register a handler for a specific button action"""
         self.button_handlers[action_id] = handler
@@ -29,11 +47,9 @@ class SlackEventHandler:
     def handle_event(self, event: Dict[str, Any]):
         """Handle incoming Slack events"""
         event_type = event.get("type")
-
-        if event_type == "events_api":
-            self._handle_events_api(event)
-        elif event_type == "interactive":
-            self._handle_interactive(event)
+        handler = self._event_handlers.get(event_type)
+        if handler:
+            handler(event)
         else:
             logger.warning(f"Unknown event type: {event_type}")
 
@@ -41,24 +57,21 @@ class SlackEventHandler:
         """Handle Events API events"""
         payload = event.get("payload", {})
         event_type = payload.get("type")
-
-        if event_type == "url_verification":
-            self._handle_url_verification(payload)
-        elif event_type == "event_callback":
-            self._handle_event_callback(payload)
+        handler = self._events_api_handlers.get(event_type)
+        if handler:
+            handler(payload)
         else:
             logger.info(f"Unhandled Events API event type: {event_type}")
 
     def _handle_interactive(self, event: Dict[str, Any]):
         """Handle interactive events (button clicks, etc.)"""
-        payload = json.loads(event.get("payload", "{}"))
-
-        if payload.get("type") == "block_actions":
-            self._handle_block_actions(payload)
-        elif payload.get("type") == "view_submission":
-            self._handle_view_submission(payload)
+        payload = loads(event.get("payload", "{}"))
+        event_type = payload.get("type")
+        handler = self._interactive_handlers.get(event_type)
+        if handler:
+            handler(payload)
         else:
-            logger.info(f"Unhandled interactive event type: {payload.get('type')}")
+            logger.info(f"Unhandled interactive event type: {event_type}")
 
     def _handle_url_verification(self, payload: Dict[str, Any]):
         """Handle URL verification challenge"""
@@ -75,11 +88,9 @@ class SlackEventHandler:
         """Handle event callbacks"""
         event = payload.get("event", {})
         event_type = event.get("type")
-
-        if event_type == "message":
-            self._handle_message(event)
-        elif event_type == "app_mention":
-            self._handle_app_mention(event)
+        handler = self._callback_handlers.get(event_type)
+        if handler:
+            handler(event)
         else:
             logger.info(f"Unhandled event callback type: {event_type}")
 
@@ -109,10 +120,14 @@ class SlackEventHandler:
         for action in actions:
             action_id = action.get("action_id", "")
 
-            # Check if we have a registered handler for this action
-            if action_id in self.button_handlers:
+            # Buttons carry "<action>_<approval_id>"; handlers are registered
+            # per action, so fall back to the prefix
+            handler = self.button_handlers.get(action_id) or self.button_handlers.get(
+                action_id.split("_", 1)[0]
+            )
+            if handler:
                 try:
-                    self.button_handlers[action_id](payload)
+                    handler(payload)
                 except Exception as e:
                     logger.error(f"Error handling button action {action_id}: {e}")
             else:
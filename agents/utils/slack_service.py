@@ -5,11 +5,12 @@ This module provides Slack integration for the kube-multi-agent system,
 including sending notifications and handling approval workflows.
 """
 
+import asyncio
 import logging
-import time
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-from uuid import uuid4
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple, TypedDict
 
 from config import config
 from slack_sdk.models.blocks import (
@@ -26,9 +27,65 @@ from slack_sdk.models.views import View
 from slack_sdk.signature import SignatureVerifier
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.web import WebClient
+from utils.ids import new_uuid
 
 logger = logging.getLogger(__name__)
 
+# Message sections are str.format templates, which are rendered in C in a
+# single pass rather than by a regex callback per placeholder.
+
+# Per-alert section of the analysis message
+_ALERT_SUMMARY = (
+    "*Alert:* {alertname}\n"
+    "*Instance:* {instance}\n"
+    "*Status:* {status}\n"
+    "*Severity:* {severity}\n"
+    "*Summary:* {summary}\n"
+    "*Description:* {description}\n"
+)
+
+# Per-step section of the remediation plan message
+_PLAN_STEP = (
+    "*Step {step_number}:* {action}\n"
+    "> *Command:* `{command}`\n"
+    "> *Dry Run:* `{dry_run_command}`\n"
+    "> *Expected:* {expected_result}\n"
+    "> *Rollback:* `{rollback_command}`\n"
+    "> *Verify:* {verification_method}\n"
+    "> *Duration:* {estimated_duration}\n"
+    "> *Step Risk:* {risk_level}\n"
+    "> *Escalate if:* {escalation_trigger}\n\n"
+)
+
+# Per-step section of the plan details modal; {rollback} is an optional line
+_PLAN_STEP_DETAIL = (
+    "**Step {index}:** {action}\n"
+    "Command: `{command}`\n"
+    "{rollback}"
+    "Expected: {expected_result}\n\n"
+)
+
+
+def _set_decided(future: asyncio.Future):
+    """Resolve an approval waiter unless it already finished or timed out"""
+    if not future.done():
+        future.set_result(None)
+
+
+class PendingApproval(TypedDict, total=False):
+    """Approval request record; decision fields are filled in on click"""
+
+    plan: Dict[str, Any]
+    alert_data: Dict[str, Any]
+    message_ts: str
+    channel: str
+    created_at: datetime
+    status: str
+    decided: threading.Event
+    on_decided: Callable[[], None]
+    approved_by: str
+    approved_at: datetime
+
 
 class SlackService:
     """Slack service for handling notifications and approvals"""
@@ -39,7 +96,14 @@ class SlackService:
             app_token=config.SLACK_APP_TOKEN, web_client=self.web_client
         )
         self.signature_verifier = SignatureVerifier(config.SLACK_SIGNING_SECRET)
-        self.pending_approvals: Dict[str, Dict[str, Any]] = {}
+        self.pending_approvals: Dict[str, PendingApproval] = {}
+
+        # Dispatch table keyed by the action_id prefix of the plan buttons
+        self._button_handlers: Dict[str, Callable[[str, str], None]] = {
+            "approve": partial(self._handle_approval, approved=True),
+            "reject": partial(self._handle_approval, approved=False),
+            "details": self._show_plan_details,
+        }
 
     def start(self):
         """Start the Slack socket client"""
@@ -70,15 +134,16 @@ class SlackService:
         for alert in alerts:
             labels = alert.get("labels", {})
             annotations = alert.get("annotations", {})
-            summary = (
-                f"*Alert:* {labels.get('alertname', 'Unknown')}\n"
-                f"*Instance:* {labels.get('instance', 'N/A')}\n"
-                f"*Status:* {alert.get('status', 'Unknown')}\n"
-                f"*Severity:* {labels.get('severity', 'Unknown')}\n"
-                f"*Summary:* {annotations.get('summary', '')}\n"
-                f"*Description:* {annotations.get('description', '')}\n"
+            alert_summaries.append(
+                _ALERT_SUMMARY.format(
+                    alertname=labels.get("alertname", "Unknown"),
+                    instance=labels.get("instance", "N/A"),
+                    status=alert.get("status", "Unknown"),
+                    severity=labels.get("severity", "Unknown"),
+                    summary=annotations.get("summary", ""),
+                    description=annotations.get("description", ""),
+                )
             )
-            alert_summaries.append(summary)
 
         blocks = [
             HeaderBlock(text=PlainTextObject(text="🔍 Incident Analysis Complete")),
@@ -132,23 +197,25 @@ class SlackService:
         self, alert_data: Dict[str, Any], plan: Dict[str, Any]
     ) -> str:
         """Send remediation plan to Slack channel and request approval"""
-        approval_id = str(uuid4())
+        approval_id = new_uuid()
 
         # Format steps summary
         steps = plan.get("steps", [])
-        steps_text = ""
-        for step in steps:
-            steps_text += (
-                f"*Step {step.get('step_number', '?')}:* {step.get('action', 'Unknown action')}\n"
-                f"> *Command:* `{step.get('command', 'N/A')}`\n"
-                f"> *Dry Run:* `{step.get('dry_run_command', 'N/A')}`\n"
-                f"> *Expected:* {step.get('expected_result', 'N/A')}\n"
-                f"> *Rollback:* `{step.get('rollback_command', 'N/A')}`\n"
-                f"> *Verify:* {step.get('verification_method', 'N/A')}\n"
-                f"> *Duration:* {step.get('estimated_duration', 'N/A')}\n"
-                f"> *Step Risk:* {step.get('risk_level', 'N/A')}\n"
-                f"> *Escalate if:* {step.get('escalation_trigger', 'N/A')}\n\n"
+        steps_text = "".join(
+            _PLAN_STEP.format(
+                step_number=step.get("step_number", "?"),
+                action=step.get("action", "Unknown action"),
+                command=step.get("command", "N/A"),
+                dry_run_command=step.get("dry_run_command", "N/A"),
+                expected_result=step.get("expected_result", "N/A"),
+                rollback_command=step.get("rollback_command", "N/A"),
+                verification_method=step.get("verification_method", "N/A"),
+                estimated_duration=step.get("estimated_duration", "N/A"),
+                risk_level=step.get("risk_level", "N/A"),
+                escalation_trigger=step.get("escalation_trigger", "N/A"),
             )
+            for step in steps
+        )
 
         # Format list fields
         def fmt_list(key):
@@ -267,36 +334,59 @@ class SlackService:
             "channel": config.SLACK_CHANNEL_ID,
             "created_at": datetime.now(),
             "status": "pending",
+            "decided": threading.Event(),
         }
 
         return approval_id
 
     def wait_for_approval(self, approval_id: str) -> Optional[bool]:
         """Wait for approval decision with timeout"""
-        start_time = datetime.now()
-        timeout = timedelta(seconds=config.SLACK_APPROVAL_TIMEOUT)
-
-        while datetime.now() - start_time < timeout:
-            if approval_id in self.pending_approvals:
-                approval_data = self.pending_approvals[approval_id]
-                if approval_data["status"] in ["approved", "rejected"]:
-                    result = approval_data["status"] == "approved"
-                    del self.pending_approvals[approval_id]
-                    return result
+        approval_data = self.pending_approvals.get(approval_id)
+        if approval_data is None:
+            return None
 
-            time.sleep(1)
+        # Woken by the button click instead of polling every second
+        decided = approval_data["decided"].wait(config.SLACK_APPROVAL_TIMEOUT)
+        self.pending_approvals.pop(approval_id, None)
+        if decided:
+            return approval_data["status"] == "approved"
 
         # Timeout reached
-        if approval_id in self.pending_approvals:
-            self._handle_approval_timeout(approval_id)
-            del self.pending_approvals[approval_id]
-
+        self._handle_approval_timeout(approval_data)
         return None
 
-    def _handle_approval_timeout(self, approval_id: str):
+    async def await_approval(
+        self, approval_id: str
+    ) -> Tuple[Optional[bool], Optional[str]]:
+        """Wait for approval decision with timeout, without holding a thread.
+
+        Returns whether the plan was approved (None on timeout) and the Slack
+        user id of whoever decided.
+        """
+        approval_data = self.pending_approvals.get(approval_id)
+        if approval_data is None:
+            return None, None
+
+        loop = asyncio.get_running_loop()
+        decided = loop.create_future()
+        # Clicks are handled on the socket client thread
+        approval_data["on_decided"] = partial(
+            loop.call_soon_threadsafe, _set_decided, decided
+        )
+        if approval_data["decided"].is_set():
+            _set_decided(decided)
+        try:
+            await asyncio.wait_for(decided, config.SLACK_APPROVAL_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.pending_approvals.pop(approval_id, None)
+            await asyncio.to_thread(self._handle_approval_timeout, approval_data)
+            return None, None
+        finally:
+            self.pending_approvals.pop(approval_id, None)
+        return approval_data["status"] == "approved", approval_data.get("approved_by")
+
+    def _handle_approval_timeout(self, approval_data: PendingApproval):
         """Handle approval timeout"""
-        approval_data = self.pending_approvals[approval_id]
-
         blocks = [
             SectionBlock(
                 text=MarkdownTextObject(
@@ -321,27 +411,34 @@ class SlackService:
 
     def handle_button_click(self, payload: Dict[str, Any]):
         """Handle button click events from Slack"""
-        action_id = payload.get("actions", [{}])[0].get("action_id", "")
-        value = payload.get("actions", [{}])[0].get("value", "")
+        action = next(iter(payload.get("actions") or ()), {})
+        action_id = action.get("action_id", "")
+        value = action.get("value", "")
 
         if not value or value not in self.pending_approvals:
             return
 
-        self.pending_approvals[value]
-
-        if action_id.startswith("approve_"):
-            self._handle_approval(value, True, payload.get("user", {}).get("id"))
-        elif action_id.startswith("reject_"):
-            self._handle_approval(value, False, payload.get("user", {}).get("id"))
-        elif action_id.startswith("details_"):
-            self._show_plan_details(value, payload.get("user", {}).get("id"))
+        handler = self._button_handlers.get(action_id.partition("_")[0])
+        if handler:
+            handler(value, user_id=payload.get("user", {}).get("id"))
 
     def _handle_approval(self, approval_id: str, approved: bool, user_id: str):
         """Handle approval decision"""
         approval_data = self.pending_approvals[approval_id]
-        approval_data["status"] = "approved" if approved else "rejected"
-        approval_data["approved_by"] = user_id
-        approval_data["approved_at"] = datetime.now()
+        # Repeat clicks and Slack redeliveries must not overwrite the decision
+        # or update the message again
+        if approval_data["decided"].is_set():
+            logger.info(f"Approval {approval_id} already decided - ignoring click")
+            return
+        approval_data |= {
+            "status": "approved" if approved else "rejected",
+            "approved_by": user_id,
+            "approved_at": datetime.now(),
+        }
+        approval_data["decided"].set()
+        on_decided = approval_data.get("on_decided")
+        if on_decided:
+            on_decided()
 
         status_text = "✅ *Approved*" if approved else "❌ *Rejected*"
 
@@ -371,13 +468,20 @@ class SlackService:
         plan = approval_data["plan"]
 
         # Create detailed view
-        steps_text = ""
-        for i, step in enumerate(plan.get("steps", []), 1):
-            steps_text += f"**Step {i}:** {step.get('action', 'Unknown')}\n"
-            steps_text += f"Command: `{step.get('command', 'No command')}`\n"
-            if step.get("rollback_command"):
-                steps_text += f"Rollback: `{step.get('rollback_command')}`\n"
-            steps_text += f"Expected: {step.get('expected_result', 'Unknown')}\n\n"
+        steps_text = "".join(
+            _PLAN_STEP_DETAIL.format(
+                index=i,
+                action=step.get("action", "Unknown"),
+                command=step.get("command", "No command"),
+                rollback=(
+                    f"Rollback: `{step['rollback_command']}`\n"
+                    if step.get("rollback_command")
+                    else ""
+                ),
+                expected_result=step.get("expected_result", "Unknown"),
+            )
+            for i, step in enumerate(plan.get("steps", []), 1)
+        )
 
         view = View(
             type="modal",
@@ -400,7 +504,7 @@ class SlackService:
                 ),
                 SectionBlock(
                     text=MarkdownTextObject(
-                        text=f"*Estimated Time:* {plan.get('estimated_time', 'Unknown')}"
+                        text=f"*Estimated Time:* {plan.get('estimated_execution_time', plan.get('estimated_time', 'Unknown'))}"
                     )
                 ),
                 SectionBlock(
@@ -13,4 +13,5 @@ echo "Installing dependencies..."
 uv pip install -e .
 
 echo "Starting the IRS-Kube-Multi-Agent system (FastAPI webhook and agent workflow)..."
-python agents/__main__.py serve
+cd "$(dirname "$0")/agents"
+python main.py serve